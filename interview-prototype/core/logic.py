@@ -3,9 +3,14 @@
 
 import os
 import re
+import json
+import hashlib
+import inspect
+import functools
+import threading
+from pathlib import Path
 import keyring
 import google.generativeai as genai
-from PyPDF2 import PdfReader
 import sys
 from . import prompts
 
@@ -19,11 +24,147 @@ MAX_FOLLOW_UPS_LIMIT = 5
 
 MODEL_NAME = "gemini-1.5-flash-latest"
 ERROR_PREFIX = "Error: "
+# A numbered line ("1. ...", "2) ...") with real text after the number prefix.
+_NUMBERED_QUESTION_RE = re.compile(r"^\d[\d.) ]*[^\d.) ]")
 
 # --- Keyring Constants for Gemini ---
 KEYRING_SERVICE_NAME_GEMINI = "InterviewBotPro_Gemini"
 KEYRING_USERNAME_GEMINI = "gemini_api_key"
 
+# --- LLM Response Cache ---
+# Kept outside RECORDINGS_DIR, which is wiped at the start of every interview.
+# Entries hold generated text derived from resumes, job descriptions and transcripts,
+# stored as plain JSON; deleting the directory clears it (see README).
+LLM_CACHE_DIR = Path.home() / ".cache" / "interview-evaluator" / "llm"
+LLM_CACHE_MAX_BYTES = 20 * 1024 * 1024
+
+_llm_evict_lock = threading.Lock()
+
+def _is_cacheable_result(result):
+    """Returns True if a generate_* result is a success worth persisting."""
+    if result is None:
+        return False
+    if isinstance(result, str):
+        return not result.startswith(ERROR_PREFIX)
+    if isinstance(result, dict):
+        return not result.get("error")
+    return True
+
+def _evict_llm_cache_if_needed():
+    """Drops least-recently-used entries until the cache fits LLM_CACHE_MAX_BYTES."""
+    with _llm_evict_lock:
+        entries = []
+        try:
+            for entry in os.scandir(LLM_CACHE_DIR):
+                if entry.is_file() and entry.name.endswith(".json"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError as e:
+            print(f"Warning: Could not scan LLM cache directory: {e}")
+            return
+        total = sum(size for _, size, _ in entries)
+        if total <= LLM_CACHE_MAX_BYTES:
+            return
+        for _, size, entry_path in sorted(entries):
+            try:
+                os.remove(entry_path)
+                total -= size
+            except OSError:
+                continue
+            if total <= LLM_CACHE_MAX_BYTES:
+                break
+
+def disk_cache(func):
+    """
+    Caches a generate_* result on disk, keyed by a SHA-256 of its bound arguments
+    (history lists included). Pass force_refresh=True to bypass the cached value;
+    the result is still written back. The cache is trimmed LRU-first to LLM_CACHE_MAX_BYTES.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, force_refresh=False, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key_source = json.dumps([func.__name__, bound.arguments], sort_keys=True, default=repr)
+        key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+        cache_path = LLM_CACHE_DIR / f"{key}.json"
+
+        if not force_refresh:
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                print(f"LLM cache hit for {func.__name__} ({key[:12]}).")
+                try:
+                    os.utime(cache_path)  # Refresh the entry's LRU position.
+                except OSError:
+                    pass
+                return cached
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                print(f"Warning: Ignoring unreadable LLM cache entry '{cache_path.name}': {e}")
+
+        result = func(*args, **kwargs)
+        if not _is_cacheable_result(result):
+            return result
+        # Serialize before touching the disk so an unserializable result leaves nothing behind.
+        try:
+            payload = json.dumps(result)
+        except (TypeError, ValueError) as e:
+            print(f"Warning: Not caching {func.__name__} result: {e}")
+            return result
+        tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write LLM cache entry for {func.__name__}: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+        else:
+            _evict_llm_cache_if_needed()
+        return result
+
+    return wrapper
+
+# --- PDF Text Cache ---
+PDF_CACHE_DIR = Path.home() / ".cache" / "interview-evaluator" / "pdf"
+PDF_CACHE_MAX_BYTES = 50 * 1024 * 1024
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+def _pdf_content_hash(pdf_path):
+    """SHA-1 of the file contents, streamed in 1 MB chunks. None if too large or unreadable."""
+    try:
+        if os.path.getsize(pdf_path) > PDF_CACHE_MAX_BYTES:
+            return None
+        digest = hashlib.sha1()
+        with open(pdf_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    except OSError as e:
+        print(f"Warning: Could not hash PDF '{os.path.basename(pdf_path)}': {e}")
+        return None
+
+def _write_pdf_cache(cache_path, text):
+    tmp_path = cache_path.with_suffix(f".{threading.get_ident()}.tmp")
+    try:
+        PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write PDF text cache '{cache_path.name}': {e}")
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
 # --- Core Logic Functions ---
 
 def configure_gemini():
@@ -61,8 +202,23 @@ def extract_text_from_pdf(pdf_path):
     if not pdf_path or not os.path.exists(pdf_path):
         print(f"{ERROR_PREFIX}Invalid or non-existent PDF path: {pdf_path}")
         return None
+
+    content_hash = _pdf_content_hash(pdf_path)
+    cache_path = PDF_CACHE_DIR / f"{content_hash}.txt" if content_hash else None
+    if cache_path:
+        try:
+            text = cache_path.read_text(encoding='utf-8')
+            print(f"PDF text cache hit for '{os.path.basename(pdf_path)}'.")
+            return text
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable PDF text cache '{cache_path.name}': {e}")
+
     print(f"Reading PDF: {pdf_path}...")
     try:
+        # Imported on first extraction; cached resumes never need PyPDF2.
+        from PyPDF2 import PdfReader
         reader = PdfReader(pdf_path)
         text = ""
         for page in reader.pages:
@@ -74,11 +230,14 @@ def extract_text_from_pdf(pdf_path):
             print(f"Warning: No text extracted from '{os.path.basename(pdf_path)}'.")
             return None
         print("PDF text extracted successfully.")
+        if cache_path:
+            _write_pdf_cache(cache_path, text)
         return text
     except Exception as e:
         print(f"{ERROR_PREFIX}Reading PDF '{os.path.basename(pdf_path)}': {e}")
         return None
 
+@disk_cache
 def generate_initial_questions(resume_text, job_desc_text="", model_name=MODEL_NAME, num_questions=DEFAULT_NUM_TOPICS):
     """
     Generates initial interview questions based on resume and optional job description.
@@ -123,12 +282,7 @@ def generate_initial_questions(resume_text, job_desc_text="", model_name=MODEL_N
         for line in lines:
             line_strip = line.strip()
             if line_strip and line_strip[0].isdigit():
-                first_char_index = -1
-                for i, char in enumerate(line_strip):
-                    if not char.isdigit() and char not in ['.', ' ', ')']:
-                        first_char_index = i
-                        break
-                if first_char_index != -1:
+                if _NUMBERED_QUESTION_RE.match(line_strip):
                      questions.append(line_strip)
                 else:
                      print(f"Skipping malformed question line: {line_strip}")
@@ -151,6 +305,7 @@ def generate_initial_questions(resume_text, job_desc_text="", model_name=MODEL_N
         print(f"{ERROR_PREFIX}{err_msg}")
         return None
 
+@disk_cache
 def generate_follow_up_question(context_question, user_answer, conversation_history, model_name=MODEL_NAME):
     """
     Generates a follow-up question based on the last answer and context.
@@ -195,6 +350,7 @@ def generate_follow_up_question(context_question, user_answer, conversation_hist
         print(f"{ERROR_PREFIX}Generating follow-up question: {e}")
         return None
 
+@disk_cache
 def generate_summary_review(full_history, model_name=MODEL_NAME):
     """
     Generates a performance summary and review based on the interview transcript.
@@ -248,6 +404,7 @@ def generate_summary_review(full_history, model_name=MODEL_NAME):
         print(f"{ERROR_PREFIX}{error_message}")
         return f"{ERROR_PREFIX}Could not generate summary/review.\nDetails: {e}"
 
+@disk_cache
 def generate_content_score_analysis(full_history, model_name=MODEL_NAME):
     """
     Generates a score (1-100) and analysis based on answer structure and relevance.
@@ -332,6 +489,7 @@ def generate_content_score_analysis(full_history, model_name=MODEL_NAME):
     
 
     
+@disk_cache
 def generate_qualification_assessment(resume_text, job_desc_text, full_history, model_name=MODEL_NAME):
     """
     Generates an assessment of candidate qualifications against the job description.
@@ -57,6 +57,18 @@ VIDEO_THREAD_JOIN_TIMEOUT = 7.0
 STREAMING_FPS_TARGET = 25.0
 
 stt_result_queue = queue.Queue()
+_stt_result_listener = None
+_recordings_dir_ready = False
+# Set to ask the recognition thread (and its video saver) to wind down; cleared per session.
+recognition_stop_event = threading.Event()
+_stt_thread = None
+
+def ensure_recordings_dir():
+    """Creates RECORDINGS_DIR on first call; later calls skip the filesystem round-trip."""
+    global _recordings_dir_ready
+    if not _recordings_dir_ready:
+        RECORDINGS_DIR.mkdir(parents=True, exist_ok=True)
+        _recordings_dir_ready = True
 _recognizer = None
 _ambient_noise_adjusted = False
 _adjust_lock = threading.Lock()
@@ -268,7 +280,7 @@ def _record_video_loop_for_saving(video_capture: cv2.VideoCapture,
     start_time = time.time()
 
     try:
-        while not stop_event.is_set():
+        while not stop_event.is_set() and not recognition_stop_event.is_set():
             ret, frame = video_capture.read()
 
             if not ret:
@@ -290,16 +302,49 @@ def _record_video_loop_for_saving(video_capture: cv2.VideoCapture,
         end_time = time.time()
         duration = end_time - start_time
 
+def set_stt_result_listener(listener):
+    """Registers a callable that receives STT results from the recognition thread.
+    While a listener is set, results bypass stt_result_queue; anything queued
+    while no listener was attached is handed to the new listener first."""
+    global _stt_result_listener
+    _stt_result_listener = listener
+    if listener is None:
+        return
+    # Snapshot first: a failing listener must not feed its message straight back into this loop.
+    pending = []
+    while True:
+        try:
+            pending.append(stt_result_queue.get_nowait())
+        except queue.Empty:
+            break
+    for i, message in enumerate(pending):
+        try:
+            listener(message)
+        except Exception as e:
+            print(f"Warning: STT result listener failed, keeping {len(pending) - i} queued result(s): {e}")
+            for remaining in pending[i:]:
+                stt_result_queue.put(remaining)
+            return
+
+def _post_stt_result(message: str):
+    listener = _stt_result_listener
+    if listener is not None:
+        try:
+            listener(message)
+            return
+        except Exception as e:
+            print(f"Warning: STT result listener failed, queueing result instead: {e}")
+    stt_result_queue.put(message)
+
 def _recognize_speech_thread(topic_idx: int, follow_up_idx: int):
     global _recognizer
     global _ambient_noise_adjusted
     global _adjust_lock
-    global stt_result_queue
 
     try:
         import speech_recognition as sr
     except ImportError:
-        stt_result_queue.put("STT_Error: Library Missing")
+        _post_stt_result("STT_Error: Library Missing")
         return
     try:
         import cv2
@@ -311,7 +356,7 @@ def _recognize_speech_thread(topic_idx: int, follow_up_idx: int):
             _recognizer = sr.Recognizer()
             _recognizer.dynamic_energy_threshold = False
         except Exception:
-            stt_result_queue.put("STT_Error: Recognizer Init Failed")
+            _post_stt_result("STT_Error: Recognizer Init Failed")
             return
 
     video_capture_save = None
@@ -324,7 +369,7 @@ def _recognize_speech_thread(topic_idx: int, follow_up_idx: int):
     audio_processing_done = False
 
     try:
-        RECORDINGS_DIR.mkdir(parents=True, exist_ok=True)
+        ensure_recordings_dir()
 
         if not _ambient_noise_adjusted:
             with _adjust_lock:
@@ -381,17 +426,20 @@ def _recognize_speech_thread(topic_idx: int, follow_up_idx: int):
             video_save_thread = None
             video_recording_started = False
 
+        if recognition_stop_event.is_set():
+            return
+
         try:
             with sr.Microphone() as source:
                 audio = None
                 try:
                     audio = _recognizer.listen(source, timeout=7, phrase_time_limit=45)
                 except sr.WaitTimeoutError:
-                    stt_result_queue.put("STT_Error: No speech detected.")
+                    _post_stt_result("STT_Error: No speech detected.")
                 except Exception:
-                    stt_result_queue.put(f"STT_Error: Listening Failed")
+                    _post_stt_result(f"STT_Error: Listening Failed")
 
-                if audio:
+                if audio and not recognition_stop_event.is_set():
                     try:
                         audio_filename = f"{topic_idx}.{follow_up_idx}.wav"
                         audio_filepath_obj = RECORDINGS_DIR / audio_filename
@@ -401,7 +449,7 @@ def _recognize_speech_thread(topic_idx: int, follow_up_idx: int):
                     except Exception:
                         audio_filepath_obj = None
 
-                    stt_result_queue.put("STT_Status: Processing...")
+                    _post_stt_result("STT_Status: Processing...")
                     text = None
                     prosody_score = None
                     try:
@@ -409,30 +457,30 @@ def _recognize_speech_thread(topic_idx: int, follow_up_idx: int):
                         if audio_filepath_obj and audio_filepath_obj.exists():
                             prosody_score = predict_prosody_score(str(audio_filepath_obj))
                         score_str = f"{prosody_score:.1f}" if prosody_score is not None else "N/A"
-                        stt_result_queue.put(f"STT_Success: {text} | Score: {score_str}")
+                        _post_stt_result(f"STT_Success: {text} | Score: {score_str}")
                     except sr.UnknownValueError:
-                        stt_result_queue.put("STT_Error: Could not understand audio.")
+                        _post_stt_result("STT_Error: Could not understand audio.")
                     except sr.RequestError:
-                        stt_result_queue.put(f"STT_Error: API/Network Error")
+                        _post_stt_result(f"STT_Error: API/Network Error")
                     except Exception:
-                        stt_result_queue.put(f"STT_Error: Recognition/Score Failed")
+                        _post_stt_result(f"STT_Error: Recognition/Score Failed")
 
         except OSError as e:
-            stt_result_queue.put(f"STT_Error: Mic Device Unavailable")
+            _post_stt_result(f"STT_Error: Mic Device Unavailable")
         except AttributeError:
-            stt_result_queue.put(f"STT_Error: PyAudio Missing/Failed")
+            _post_stt_result(f"STT_Error: PyAudio Missing/Failed")
         except Exception:
-            stt_result_queue.put(f"STT_Error: Mic Setup Failed")
+            _post_stt_result(f"STT_Error: Mic Setup Failed")
 
         audio_processing_done = True
 
     except OSError:
-        stt_result_queue.put(f"STT_Error: Setup Failed - Cannot create directory.")
+        _post_stt_result(f"STT_Error: Setup Failed - Cannot create directory.")
         video_recording_started = False
         if video_writer is not None and video_writer.isOpened(): video_writer.release()
         if video_capture_save is not None and video_capture_save.isOpened(): video_capture_save.release()
     except Exception:
-        stt_result_queue.put(f"STT_Error: Unexpected Thread Error")
+        _post_stt_result(f"STT_Error: Unexpected Thread Error")
         if video_save_thread is not None and video_save_thread.is_alive(): stop_video_save_event.set()
         video_recording_started = False
         if video_writer is not None and video_writer.isOpened(): video_writer.release()
@@ -466,6 +514,8 @@ def _recognize_speech_thread(topic_idx: int, follow_up_idx: int):
                 pass
 
 def start_speech_recognition(topic_idx: int, follow_up_idx: int):
+    global _stt_thread
+    recognition_stop_event.clear()
     while not stt_result_queue.empty():
         try:
             stt_result_queue.get_nowait()
@@ -474,9 +524,24 @@ def start_speech_recognition(topic_idx: int, follow_up_idx: int):
         except Exception:
             pass
 
-    stt_thread = threading.Thread(
+    _stt_thread = threading.Thread(
         target=_recognize_speech_thread,
         args=(topic_idx, follow_up_idx),
         daemon=True
     )
-    stt_thread.start()
\ No newline at end of file
+    _stt_thread.start()
+
+def stop_speech_recognition(timeout: float = 2.0) -> bool:
+    """Signals the active recognition thread to stop and waits up to timeout seconds.
+    Returns True if no recognition thread is left running."""
+    global _stt_thread
+    recognition_stop_event.set()
+    thread = _stt_thread
+    if thread is None or not thread.is_alive():
+        _stt_thread = None
+        return True
+    thread.join(timeout=timeout)
+    if thread.is_alive():
+        return False
+    _stt_thread = None
+    return True
\ No newline at end of file
@@ -29,19 +29,19 @@ for provider_name in SUPPORTED_PROVIDERS:
         print(f"TTS Facade: Error loading provider '{provider_name}': {e}")
 
 _current_provider_name = None
+_playback_started = False
+
+def is_runtime_available(name):
+    provider_module = tts_providers.get(name)
+    if not provider_module: return False
+    if name == 'gtts':
+        return bool(getattr(provider_module, 'is_available', False))
+    if name == 'openai':
+        return bool(getattr(provider_module, 'is_available', False) and getattr(provider_module, '_client_initialized', False))
+    return False
 
 def get_runtime_available_providers():
-    runtime_available = []
-    for name in potentially_available_providers:
-        provider_module = tts_providers.get(name)
-        if not provider_module: continue
-        if name == 'gtts':
-             if getattr(provider_module, 'is_available', False):
-                 runtime_available.append(name)
-        elif name == 'openai':
-             if getattr(provider_module, 'is_available', False) and getattr(provider_module, '_client_initialized', False):
-                 runtime_available.append(name)
-    return runtime_available
+    return [name for name in potentially_available_providers if is_runtime_available(name)]
 
 def set_provider(provider_name):
     global _current_provider_name
@@ -82,15 +82,14 @@ def get_next_provider(current_name):
     except Exception: return potential_list[0]
 
 def speak_text(text_to_speak, **kwargs):
-    global _current_provider_name
-    runtime_available = get_runtime_available_providers()
-    if not _current_provider_name or _current_provider_name not in runtime_available:
+    global _current_provider_name, _playback_started
+    if not _current_provider_name or not is_runtime_available(_current_provider_name):
         print(f"TTS Facade: Current provider '{_current_provider_name}' invalid/unavailable at runtime.")
         new_provider_set = False
         if DEFAULT_PROVIDER in potentially_available_providers:
             print(f"TTS Facade: Trying default provider '{DEFAULT_PROVIDER}'.")
             if set_provider(DEFAULT_PROVIDER):
-                 if _current_provider_name in get_runtime_available_providers():
+                 if is_runtime_available(_current_provider_name):
                      new_provider_set = True
                  else:
                       _current_provider_name = None
@@ -98,7 +97,7 @@ def speak_text(text_to_speak, **kwargs):
         if not new_provider_set and potential_list:
              print(f"TTS Facade: Trying first potential provider '{potential_list[0]}'.")
              if set_provider(potential_list[0]):
-                 if _current_provider_name in get_runtime_available_providers():
+                 if is_runtime_available(_current_provider_name):
                      new_provider_set = True
                  else:
                       _current_provider_name = None
@@ -108,10 +107,11 @@ def speak_text(text_to_speak, **kwargs):
     if _current_provider_name in tts_providers:
         provider_module = tts_providers[_current_provider_name]
         try:
-            if _current_provider_name not in get_runtime_available_providers():
+            if not is_runtime_available(_current_provider_name):
                  raise RuntimeError(f"Provider '{_current_provider_name}' became unavailable before speech call.")
             if hasattr(provider_module, 'stop_playback'):
                 provider_module.stop_playback()
+            _playback_started = True
             provider_module.speak_text(text_to_speak, **kwargs)
         except AttributeError:
             fallback_say(text_to_speak, f"Provider '{_current_provider_name}' misconfigured (no speak_text/stop_playback).")
@@ -121,6 +121,19 @@ def speak_text(text_to_speak, **kwargs):
     else:
         fallback_say(text_to_speak, f"Selected provider '{_current_provider_name}' not loaded.")
 
+def stop_playback():
+    """Stops the active provider's playback; a no-op if nothing was spoken since the last stop."""
+    global _playback_started
+    if not _playback_started:
+        return
+    _playback_started = False
+    provider_module = tts_providers.get(_current_provider_name)
+    if provider_module and hasattr(provider_module, 'stop_playback'):
+        try:
+            provider_module.stop_playback()
+        except Exception as e:
+            print(f"TTS Facade Error stopping '{_current_provider_name}': {e}")
+
 def fallback_say(text, reason):
     print(f"TTS Facade: {reason}"); print("TTS Facade: Attempting system 'say' command fallback...")
     try:
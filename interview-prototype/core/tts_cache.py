@@ -0,0 +1,78 @@
+# core/tts_cache.py
+import os
+import hashlib
+import threading
+from pathlib import Path
+
+TTS_CACHE_DIR = Path.home() / ".cache" / "interview-evaluator" / "tts"
+TTS_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+_evict_lock = threading.Lock()
+
+def cache_path(provider, voice, text, suffix):
+    """Path of the cached audio for (provider, voice, text); voice covers model/lang too."""
+    key_source = "\0".join((provider, voice, text.strip()))
+    key = hashlib.sha1(key_source.encode("utf-8")).hexdigest()
+    return TTS_CACHE_DIR / f"{key}.{suffix}"
+
+def contains(path):
+    """True if the entry exists; also refreshes its LRU position."""
+    try:
+        os.utime(path)
+        return True
+    except OSError:
+        return False
+
+def load(path):
+    """Returns cached audio bytes, or None on a miss. A hit refreshes the file's LRU position."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        print(f"TTS_Cache: Ignoring unreadable entry '{path.name}': {e}")
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return data
+
+def store(path, audio_bytes):
+    """Atomically writes audio bytes to the cache, then trims it back under TTS_CACHE_MAX_BYTES."""
+    if not audio_bytes:
+        return False
+    tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+    try:
+        TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(audio_bytes)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"TTS_Cache: Could not write entry '{path.name}': {e}")
+        return False
+    _evict_if_needed()
+    return True
+
+def _evict_if_needed():
+    with _evict_lock:
+        entries = []
+        try:
+            for entry in os.scandir(TTS_CACHE_DIR):
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        except OSError as e:
+            print(f"TTS_Cache: Could not scan cache directory: {e}")
+            return
+        total = sum(size for _, size, _ in entries)
+        if total <= TTS_CACHE_MAX_BYTES:
+            return
+        for _, size, entry_path in sorted(entries):
+            try:
+                os.remove(entry_path)
+                total -= size
+            except OSError:
+                continue
+            if total <= TTS_CACHE_MAX_BYTES:
+                break
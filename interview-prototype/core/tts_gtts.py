@@ -6,6 +6,8 @@ import tempfile
 import io
 import sys
 
+from . import tts_cache
+
 try:
     from gtts import gTTS
     _gtts_lib_imported = True
@@ -41,12 +43,20 @@ def _gtts_speak_worker(text_to_speak, lang):
     if not is_available: print("TTS_GTTS Worker Error: gTTS or playsound library not available."); return
     print(f"TTS_GTTS Worker: Synthesizing '{text_to_speak[:60]}...' (lang={lang})")
     start_time = time.time(); temp_audio_file = None
+    cached_path = tts_cache.cache_path("gtts", lang, text_to_speak, "mp3")
     try:
         if _stop_requested.is_set(): print("TTS_GTTS Worker: Stop requested before synthesis."); return
 
+        if tts_cache.contains(cached_path):
+            print(f"TTS_GTTS Worker: Playing cached audio from {cached_path}...")
+            playsound(str(cached_path))
+            print(f"TTS_GTTS Worker: Finished cached playback. Total time: {time.time() - start_time:.2f}s")
+            return
+
         tts = gTTS(text=text_to_speak, lang=lang)
         mp3_fp = io.BytesIO()
         tts.write_to_fp(mp3_fp)
+        tts_cache.store(cached_path, mp3_fp.getvalue())
         mp3_fp.seek(0)
 
         generation_time = time.time()
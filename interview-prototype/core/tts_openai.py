@@ -7,6 +7,8 @@ import queue
 import sys
 import os
 
+from . import tts_cache
+
 try:
     import nltk
     _nltk_available = True
@@ -195,13 +197,17 @@ def _synthesize_batch(batch_text, voice, model):
     if not clean_batch_text:
         return None
     pcm_data = None
+    cached_path = tts_cache.cache_path("openai", f"{model}/{voice}", clean_batch_text, RESPONSE_FORMAT)
     try:
-        response = _openai_client.audio.speech.create(
-            model=model, voice=voice, input=clean_batch_text, response_format=RESPONSE_FORMAT
-        )
-        audio_bytes = response.content
-        if not audio_bytes:
-            return None
+        audio_bytes = tts_cache.load(cached_path)
+        if audio_bytes is None:
+            response = _openai_client.audio.speech.create(
+                model=model, voice=voice, input=clean_batch_text, response_format=RESPONSE_FORMAT
+            )
+            audio_bytes = response.content
+            if not audio_bytes:
+                return None
+            tts_cache.store(cached_path, audio_bytes)
         audio_stream = io.BytesIO(audio_bytes)
         try:
             data, samplerate = sf.read(audio_stream, dtype=None, always_2d=False)
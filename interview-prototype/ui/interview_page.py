@@ -26,10 +26,15 @@ class InterviewPage(QWidget):
         """Initializes the InterviewPage."""
         super().__init__(parent=parent_window, *args, **kwargs)
         self.parent_window = parent_window
+        self._placeholder_pixmaps = {}
         self._load_dynamic_icons()
         self._init_ui()
         self.set_input_mode(use_speech=False)
 
+        mark_ready = getattr(parent_window, '_mark_interview_ui_ready', None)
+        if mark_ready:
+            mark_ready(self)
+
     def _load_dynamic_icons(self):
         """Load icons used for the submit/record button states."""
         pw = self.parent_window
@@ -101,14 +106,7 @@ class InterviewPage(QWidget):
         self.webcam_view_label.setObjectName("webcamViewLabel")
         self.webcam_view_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.webcam_view_label.setMinimumSize(320, 240)
-        placeholder_pixmap = QPixmap(self.webcam_view_label.minimumSize())
-        placeholder_pixmap.fill(QColor("black"))
-        painter = QPainter(placeholder_pixmap)
-        painter.setPen(QColor("grey"))
-        painter.setFont(font_default)
-        painter.drawText(placeholder_pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "Webcam View (STT Mode)")
-        painter.end()
-        self.webcam_view_label.setPixmap(placeholder_pixmap)
+        self.webcam_view_label.setPixmap(self._placeholder_pixmap("Webcam View (STT Mode)"))
         self.webcam_view_label.setSizePolicy(
              QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding
         )
@@ -174,14 +172,7 @@ class InterviewPage(QWidget):
             self.answer_input.clear()
         # Reset webcam view to placeholder
         if hasattr(self, 'webcam_view_label'):
-            placeholder_pixmap = QPixmap(self.webcam_view_label.minimumSize())
-            placeholder_pixmap.fill(QColor("black"))
-            painter = QPainter(placeholder_pixmap)
-            painter.setPen(QColor("grey"))
-            painter.setFont(getattr(self.parent_window, 'font_default', QFont()))
-            painter.drawText(placeholder_pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "Webcam View (STT Mode)")
-            painter.end()
-            self.webcam_view_label.setPixmap(placeholder_pixmap)
+            self.webcam_view_label.setPixmap(self._placeholder_pixmap("Webcam View (STT Mode)"))
 
 
     def set_controls_enabled(self, enabled: bool, is_recording_stt: bool = False):
@@ -213,6 +204,20 @@ class InterviewPage(QWidget):
             self.question_text_label.setText(question_text)
             self.question_text_label.updateGeometry()
 
+    def _placeholder_pixmap(self, text: str) -> QPixmap:
+        """Returns the webcam placeholder showing text, painting it only on first use."""
+        pixmap = self._placeholder_pixmaps.get(text)
+        if pixmap is None:
+            pixmap = QPixmap(self.webcam_view_label.minimumSize())
+            pixmap.fill(QColor("black"))
+            painter = QPainter(pixmap)
+            painter.setPen(QColor("grey"))
+            painter.setFont(getattr(self.parent_window, 'font_default', QFont()))
+            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+            painter.end()
+            self._placeholder_pixmaps[text] = pixmap
+        return pixmap
+
     def set_webcam_frame(self, pixmap: QPixmap | None):
         """Sets the pixmap on the webcam view label."""
         if hasattr(self, 'webcam_view_label'):
@@ -223,11 +228,4 @@ class InterviewPage(QWidget):
                     Qt.TransformationMode.SmoothTransformation
                 ))
             else:
-                 placeholder_pixmap = QPixmap(self.webcam_view_label.minimumSize())
-                 placeholder_pixmap.fill(QColor("black"))
-                 painter = QPainter(placeholder_pixmap)
-                 painter.setPen(QColor("grey"))
-                 painter.setFont(getattr(self.parent_window, 'font_default', QFont()))
-                 painter.drawText(placeholder_pixmap.rect(), Qt.AlignmentFlag.AlignCenter, "No Signal / Stopped")
-                 painter.end()
-                 self.webcam_view_label.setPixmap(placeholder_pixmap)
\ No newline at end of file
+                 self.webcam_view_label.setPixmap(self._placeholder_pixmap("No Signal / Stopped"))
\ No newline at end of file
@@ -3,15 +3,17 @@ import os
 import sys
 import queue
 import platform
-import subprocess
-import html
 import json
+import hashlib
 import shutil
 from pathlib import Path
 import numpy as np
 import cv2
 import threading
+import functools
+from contextlib import contextmanager
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QMessageBox, QFileDialog, QApplication,
@@ -23,7 +25,8 @@ from PyQt6.QtGui import (
     QDesktopServices, QImage, QPainter
 )
 from PyQt6.QtCore import (
-    Qt, QTimer, QSize, pyqtSignal, QUrl, QStandardPaths
+    Qt, QTimer, QSize, pyqtSignal, QUrl, QStandardPaths, QThreadPool, QProcess,
+    QSignalBlocker
 )
 
 try:
@@ -40,12 +43,130 @@ from .setup_page import SetupPage
 from .interview_page import InterviewPage
 from .results_page import ResultsContainerPage
 from .loading_page import LoadingPage
+from .workers import Worker
 
 CONFIG_FILE_NAME = "settings.json"
 RESUMES_SUBDIR = "resumes"
 MAX_RECENT_RESUMES = 10
 MAX_RECENT_JDS = 10
 WEBCAM_UPDATE_INTERVAL = 40
+CONFIG_FLUSH_DELAY_MS = 200
+STT_WATCHDOG_INTERVAL_MS = 2000
+
+_HISTORY_LOG_PREFIXES = {
+    "question_style": "HISTORY [Q]: ",
+    "answer_style": "HISTORY [A]: ",
+    "topic_marker": "HISTORY [T]: ",
+}
+_HISTORY_DEFAULT_PREFIX = "HISTORY [I]: "
+PROGRESS_ACTIVE_COLOR = "#ffa500"
+FOLLOW_UP_FILLER_DELAY_MS = 400
+FOLLOW_UP_FILLER_TEXT = "Let me think about that..."
+
+def _detect_open_command(system):
+    # Resolved once to absolute paths so opening the folder never repeats the PATH search.
+    if system == "Windows":
+        return None
+    if system == "Darwin":
+        return [shutil.which("open") or "/usr/bin/open"]
+    xdg_open = shutil.which("xdg-open")
+    if xdg_open:
+        return [xdg_open]
+    gio = shutil.which("gio")
+    if gio:
+        return [gio, "open"]
+    return None
+
+_SYSTEM = platform.system()
+_HOME_DIR = str(Path.home())
+_OPEN_CMD = _detect_open_command(_SYSTEM)
+_OPEN_CMD_LABEL = " ".join(_OPEN_CMD) if _OPEN_CMD else "xdg-open/gio"
+
+def _build_dark_palette(base: QPalette) -> QPalette:
+    palette = QPalette(base)
+    palette.setColor(QPalette.ColorRole.Window, QColor(45, 45, 45))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(220, 220, 220))
+    palette.setColor(QPalette.ColorRole.Base, QColor(35, 35, 35))
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
+    palette.setColor(QPalette.ColorRole.ToolTipBase, Qt.GlobalColor.white)
+    palette.setColor(QPalette.ColorRole.ToolTipText, QColor(50, 50, 50))
+    palette.setColor(QPalette.ColorRole.Text, QColor(220, 220, 220))
+    palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(220, 220, 220))
+    palette.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
+    palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
+    palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
+    palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
+
+    disabled_text_color = QColor(128, 128, 128)
+    palette.setColor(QPalette.ColorRole.PlaceholderText, disabled_text_color)
+    palette.setColor(
+        QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, disabled_text_color
+    )
+    palette.setColor(
+        QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, disabled_text_color
+    )
+    return palette
+
+def _qthrottled(fn, timeout_ms=50, parent=None):
+    """Trailing-edge throttle: calls within timeout_ms collapse into one call with the latest args."""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(timeout_ms)
+    latest = [(), {}]
+
+    def fire():
+        args, kwargs = latest
+        fn(*args, **kwargs)
+
+    def throttled(*args, **kwargs):
+        latest[0], latest[1] = args, kwargs
+        if not timer.isActive():
+            timer.start()
+
+    def flush():
+        if timer.isActive():
+            timer.stop()
+            fire()
+
+    timer.timeout.connect(fire)
+    throttled.flush = flush
+    return throttled
+
+_FONTS = None
+
+def _get_fonts():
+    """Builds the shared font set once a QApplication exists; returns None before that."""
+    global _FONTS
+    if _FONTS is None and QApplication.instance() is not None:
+        font_default = QFont("Arial", 10)
+        font_bold = QFont("Arial", 10, QFont.Weight.Bold)
+        font_small = QFont("Arial", 9)
+        font_large_bold = QFont("Arial", 12, QFont.Weight.Bold)
+        base_size = font_default.pointSize()
+        _FONTS = {
+            "default": font_default,
+            "bold": font_bold,
+            "small": font_small,
+            "large_bold": font_large_bold,
+            "history": QFont("Monospace", 9),
+            "default_xxl": QFont(font_default.family(), base_size + 6),
+            "bold_xxl": QFont(font_bold.family(), base_size + 6, QFont.Weight.Bold),
+            "small_xxl": QFont(font_small.family(), base_size + 5),
+            "group_title_xxl": QFont(font_large_bold.family(), base_size + 8, QFont.Weight.Bold),
+        }
+    return _FONTS
+
+# Built on first use: QPalette needs a running QApplication for its base roles.
+_DARK_PALETTE = None
+
+_LEADING_NUM_RE = re.compile(r"^\d{1,2}[.)\s]+")
+_MD_STRIP_TABLE = str.maketrans('', '', '*')
+_TAG_STRIP_RE = re.compile(r"</?[bi]>", re.IGNORECASE)
+
+def _strip_markup(s):
+    s = s.translate(_MD_STRIP_TABLE)
+    return _TAG_STRIP_RE.sub("", s) if "<" in s else s
 
 class InterviewApp(QWidget):
     SETUP_PAGE_INDEX = 0
@@ -53,12 +174,33 @@ class InterviewApp(QWidget):
     LOADING_PAGE_INDEX = 2
     RESULTS_CONTAINER_INDEX = 3
 
+    stt_result_ready = pyqtSignal(object)
+
+    _style_set = False
+    _app_font_set = False
+    # Directories already created this run; skips repeated mkdir/stat calls.
+    _ensured_dirs = set()
+
     SPEECH_DESCRIPTION_PLACEHOLDER = """
 **Prosody Analysis:**
 *(Analysis based on overall average speech delivery score from recorded answers.)*
 
 *(Note: This score reflects aspects like pitch variation, speaking rate pauses, and intensity variation, compared to a baseline model. Individual segment scores contribute to this average.)*
 """
+    _SPEECH_DESCRIPTION_PLAIN = _strip_markup(SPEECH_DESCRIPTION_PLACEHOLDER)
+
+    # update_status_stt: exact status messages, then (prefix, template, button state, stops recording).
+    _STT_STATUS_MAP = {
+        "STT_Status: Starting Mic...": ("[Starting Microphone...]", 'processing'),
+        "STT_Status: Adjusting Mic...": ("[Calibrating microphone threshold...]", 'processing'),
+        "STT_Status: Listening...": ("[Listening... Speak Now]", 'listening'),
+        "STT_Status: Processing...": ("[Processing Speech... Please Wait]", 'processing'),
+    }
+    _STT_PREFIX_MAP = (
+        ("STT_Warning:", "[STT Warning: {}]", 'idle', True),
+        ("STT_Error:", "[STT Error: {}]", 'idle', True),
+        ("STT_Success:", "[Speech Recognized Successfully]", 'processing', False),
+    )
 
     def __init__(self, icon_path, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -71,13 +213,31 @@ class InterviewApp(QWidget):
         self._init_state()
         self._ensure_app_dirs_exist()
         self.config = self._load_config()
+        self._jd_name_set = {item.get("name") for item in self.config.get("recent_job_descriptions", [])}
         self._setup_ui()
         self._update_ui_from_state()
         self._update_progress_indicator()
 
-        self.stt_timer = QTimer(self)
-        self.stt_timer.timeout.connect(self.check_stt_queue)
-        self.stt_timer.start(100)
+        self.stt_result_ready.connect(self._on_stt_result, Qt.ConnectionType.QueuedConnection)
+        recording.set_stt_result_listener(self.stt_result_ready.emit)
+        # Results are pushed; this coarse watchdog only picks up anything that fell back to
+        # recording.stt_result_queue (listener failure) and runs only while recording.
+        self._stt_watchdog = QTimer(self)
+        self._stt_watchdog.setTimerType(Qt.TimerType.CoarseTimer)
+        self._stt_watchdog.setInterval(STT_WATCHDOG_INTERVAL_MS)
+        self._stt_watchdog.timeout.connect(self._drain_stt_fallback_queue)
+
+        # Dedicated single-thread pool: utterances play in order without parking
+        # global pool threads that the LLM workers need.
+        self._tts_pool = QThreadPool(self)
+        self._tts_pool.setMaxThreadCount(1)
+        self._pending_follow_up_signals = None
+        self._pending_resume = None
+        self._closing = False
+        self._filler_timer = QTimer(self)
+        self._filler_timer.setSingleShot(True)
+        self._filler_timer.setInterval(FOLLOW_UP_FILLER_DELAY_MS)
+        self._filler_timer.timeout.connect(self._play_thinking_filler)
 
         self.webcam_frame_queue = queue.Queue(maxsize=5)
         self.webcam_timer = QTimer(self)
@@ -85,51 +245,48 @@ class InterviewApp(QWidget):
         self.webcam_stream_thread = None
         self.webcam_stream_stop_event = None
 
-    def _setup_appearance(self):
-        palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(45, 45, 45))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(220, 220, 220))
-        palette.setColor(QPalette.ColorRole.Base, QColor(35, 35, 35))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, Qt.GlobalColor.white)
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(50, 50, 50))
-        palette.setColor(QPalette.ColorRole.Text, QColor(220, 220, 220))
-        palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(220, 220, 220))
-        palette.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
-        palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-        palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
-
-        disabled_text_color = QColor(128, 128, 128)
-        palette.setColor(QPalette.ColorRole.PlaceholderText, disabled_text_color)
-        palette.setColor(
-            QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, disabled_text_color
-        )
-        palette.setColor(
-            QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, disabled_text_color
-        )
+    @property
+    def pdf_filepath(self):
+        return self._pdf_filepath
+
+    @pdf_filepath.setter
+    def pdf_filepath(self, value):
+        # Existence is checked once per change so UI refreshes don't stat the file.
+        self._pdf_filepath = value
+        self._pdf_loaded_cached = bool(value) and Path(value).exists()
 
-        self.setPalette(palette)
-        QApplication.setStyle("Fusion")
+    def _setup_appearance(self):
+        global _DARK_PALETTE
+        if _DARK_PALETTE is None:
+            _DARK_PALETTE = _build_dark_palette(self.palette())
+        self.setPalette(QPalette(_DARK_PALETTE))
+        if not InterviewApp._style_set:
+            QApplication.setStyle("Fusion")
+            InterviewApp._style_set = True
 
     def _load_assets(self):
         self.icon_size = QSize(24, 24)
-        self.font_default = QFont("Arial", 10)
-        self.font_bold = QFont("Arial", 10, QFont.Weight.Bold)
-        self.font_small = QFont("Arial", 9)
-        self.font_large_bold = QFont("Arial", 12, QFont.Weight.Bold)
-        self.font_history = QFont("Monospace", 9)
-        base_size = self.font_default.pointSize()
-        self.font_default_xxl = QFont(self.font_default.family(), base_size + 6)
-        self.font_bold_xxl = QFont(
-            self.font_bold.family(), base_size + 6, QFont.Weight.Bold
-        )
-        self.font_small_xxl = QFont(self.font_small.family(), base_size + 5)
-        self.font_group_title_xxl = QFont(
-            self.font_large_bold.family(), base_size + 8, QFont.Weight.Bold
-        )
+        fonts = _get_fonts()
+        self.font_default = fonts["default"]
+        self.font_bold = fonts["bold"]
+        self.font_small = fonts["small"]
+        self.font_large_bold = fonts["large_bold"]
+        self.font_history = fonts["history"]
+        self.font_default_xxl = fonts["default_xxl"]
+        self.font_bold_xxl = fonts["bold_xxl"]
+        self.font_small_xxl = fonts["small_xxl"]
+        self.font_group_title_xxl = fonts["group_title_xxl"]
         self.font_progress_indicator = self.font_default_xxl
+        if not InterviewApp._app_font_set:
+            QApplication.setFont(self.font_default)
+            InterviewApp._app_font_set = True
+        self._page_step_index = {
+            self.SETUP_PAGE_INDEX: 0,
+            self.INTERVIEW_PAGE_INDEX: 1,
+            self.LOADING_PAGE_INDEX: 1,
+            self.RESULTS_CONTAINER_INDEX: 2,
+        }
+        self._progress_html = self._build_progress_html()
 
     def _init_state(self):
         self.pdf_filepath = None
@@ -140,28 +297,58 @@ class InterviewApp(QWidget):
         self.max_follow_ups = logic.DEFAULT_MAX_FOLLOW_UPS
         self.use_speech_input = False
         self.use_openai_tts = False
+        self._tts_provider_dirty = False
         self.initial_questions = []
-        self.cleaned_initial_questions = set()
+        self.cleaned_initial_questions = frozenset()
+        self._cleaned_initial_questions_list = []
+        self._initial_topic_index = {}
         self.current_initial_q_index = -1
         self.current_topic_question = ""
         self.current_topic_history = []
         self.follow_up_count = 0
         self.current_full_interview_history = []
+        self.force_llm_refresh = False
         self.is_recording = False
         self.last_question_asked = ""
         self.last_assessment_data = None
         self.last_content_score_data = None
         self.last_average_speech_score = 0.0
+        self._results_ready = False
+        self._pending_topic_marker = None
         self.app_data_dir = self._get_app_data_dir()
         self.config_path = self.app_data_dir / CONFIG_FILE_NAME
         self.resumes_dir = self.app_data_dir / RESUMES_SUBDIR
+        self._recordings_path = RECORDINGS_DIR
         self.config = {"recent_resumes": [], "recent_job_descriptions": []}
+        self._jd_name_set = set()
+        self._config_dirty = False
+        self._last_config_hash = None
+        self._config_flush_timer = QTimer(self)
+        self._config_flush_timer.setSingleShot(True)
+        self._config_flush_timer.setInterval(CONFIG_FLUSH_DELAY_MS)
+        self._config_flush_timer.timeout.connect(self._flush_config)
         self.setup_page_instance = None
         self.interview_page_instance = None
+        self._interview_ui_ready = False
+        self._answer_input = None
+        self._submit_button = None
+        self._webcam_view_label = None
+        self._submit_icon = None
+        self._record_icon = None
+        self._listening_icon = None
+        self._processing_icon = None
+        self._button_state_table = {}
         self.loading_page_instance = None
         self.results_container_instance = None
         self.progress_indicator_label = None
         self.status_bar_label = None
+        self._progress_throttle = _qthrottled(self._refresh_progress_indicator, 50, self)
+        self._progress_step_shown = None
+        self._busy_override_depth = 0
+        self._submit_refresh_pending = False
+        self._ui_update_depth = 0
+        self._ui_update_pending = False
+        self._pending_stt_status = None
         self.stacked_widget = None
         self.current_speech_score_sum = 0.0
         self.current_speech_score_count = 0
@@ -171,9 +358,7 @@ class InterviewApp(QWidget):
             QStandardPaths.StandardLocation.AppDataLocation
         )
         if not app_data_dir_str:
-            self_data_dir_str = os.path.join(
-                os.path.expanduser("~"), ".InterviewBotPro"
-            )
+            app_data_dir_str = os.path.join(_HOME_DIR, ".InterviewBotPro")
             print(
                 f"Warning: Could not get standard AppDataLocation. "
                 f"Using fallback: {app_data_dir_str}"
@@ -184,13 +369,19 @@ class InterviewApp(QWidget):
         else:
              return base_path
 
+    @staticmethod
+    def _ensure_dir(path: Path):
+        if path not in InterviewApp._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            InterviewApp._ensured_dirs.add(path)
+
     def _ensure_app_dirs_exist(self):
         try:
-            self.app_data_dir.mkdir(parents=True, exist_ok=True)
-            self.resumes_dir.mkdir(parents=True, exist_ok=True)
-            Path(RECORDINGS_DIR).mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(self.app_data_dir)
+            self._ensure_dir(self.resumes_dir)
+            recording.ensure_recordings_dir()
             print(f"Ensured app data directories exist: {self.app_data_dir}")
-            print(f"Ensured recordings directory exists: {RECORDINGS_DIR}")
+            print(f"Ensured recordings directory exists: {self._recordings_path}")
         except OSError as e:
             print(f"CRITICAL ERROR: Could not create app directories: {e}")
             self.show_message_box(
@@ -210,8 +401,9 @@ class InterviewApp(QWidget):
             return default_config
 
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config_blob = self.config_path.read_bytes()
+            config = json.loads(config_blob.decode('utf-8'))
+            self._last_config_hash = hashlib.blake2b(config_blob).digest()
 
             needs_save = False
 
@@ -220,17 +412,18 @@ class InterviewApp(QWidget):
                 config["recent_resumes"] = []
                 needs_save = True
             else:
+                # One directory listing instead of a stat per entry; managed resumes live
+                # directly in resumes_dir.
+                try:
+                    with os.scandir(self.resumes_dir) as entries:
+                        present = {entry.name for entry in entries if entry.is_file()}
+                except OSError:
+                    present = set()
                 valid_resumes = []
                 for item in config.get("recent_resumes", []):
                     if isinstance(item, dict) and 'name' in item and 'path' in item:
                         p = Path(item['path'])
-                        is_valid = False
-                        if p.is_absolute() and p.exists():
-                             try:
-                                 if p.is_relative_to(self.resumes_dir):
-                                     is_valid = True
-                             except ValueError:
-                                 pass
+                        is_valid = p.parent == self.resumes_dir and p.name in present
                         if is_valid:
                             valid_resumes.append(item)
                         else:
@@ -275,10 +468,32 @@ class InterviewApp(QWidget):
              return default_config
 
     def _save_config(self, config_data=None):
-        data_to_save = config_data if config_data is not None else self.config
+        # self.config is the source of truth; bursts of changes are written once after a short delay.
+        if config_data is not None:
+            self.config = config_data
+        self._config_dirty = True
+        self._schedule_config_flush()
+
+    def _schedule_config_flush(self):
+        # A pending flush already covers this change; restarting it would let a steady
+        # stream of edits postpone the write indefinitely.
+        if not self._config_flush_timer.isActive():
+            self._config_flush_timer.start()
+
+    def _flush_config(self):
+        if not self._config_dirty:
+            return
+        tmp_path = self.config_path.with_suffix(".json.tmp")
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(data_to_save, f, indent=4)
+            config_blob = json.dumps(self.config, indent=4).encode('utf-8')
+            config_hash = hashlib.blake2b(config_blob).digest()
+            if config_hash == self._last_config_hash:
+                self._config_dirty = False
+                return
+            tmp_path.write_bytes(config_blob)
+            os.replace(tmp_path, self.config_path)
+            self._last_config_hash = config_hash
+            self._config_dirty = False
             print(f"Config saved to {self.config_path}")
         except IOError as e:
             print(f"Error saving config file {self.config_path}: {e}")
@@ -299,37 +514,34 @@ class InterviewApp(QWidget):
              print(f"Error: Attempted to add path on different drive to recent resumes: {path_in_resumes_dir}")
              return
 
-        new_entry = {"name": name, "path": str(p)}
-        recent_list = self.config.get("recent_resumes", [])
-
-        existing_indices = [
-            i for i, item in enumerate(recent_list) if item.get("path") == str(p)
+        path_str = str(p)
+        recent_list = [
+            item for item in self.config.get("recent_resumes", []) if item.get("path") != path_str
         ]
-        for i in reversed(existing_indices):
-            del recent_list[i]
-
+        new_entry = {"name": name, "path": path_str}
         recent_list.insert(0, new_entry)
         self.config["recent_resumes"] = recent_list[:MAX_RECENT_RESUMES]
         self._save_config()
-        self._update_ui_from_state()
+        if self.setup_page_instance:
+            self.setup_page_instance.prepend_recent_resume(new_entry, MAX_RECENT_RESUMES)
 
     def _add_recent_jd(self, name: str, text: str):
         if not name or text is None:
             print("Warning: Attempted to add recent JD with missing name or text.")
             return
 
-        new_entry = {"name": name, "text": text}
-        jd_list = self.config.get("recent_job_descriptions", [])
-
-        existing_indices = [
-            i for i, item in enumerate(jd_list) if item.get("name") == name
+        jd_list = [
+            item for item in self.config.get("recent_job_descriptions", []) if item.get("name") != name
         ]
-        for i in reversed(existing_indices):
-            del jd_list[i]
-
+        new_entry = {"name": name, "text": text}
         jd_list.insert(0, new_entry)
         self.config["recent_job_descriptions"] = jd_list[:MAX_RECENT_JDS]
+        self._jd_name_set.add(name)
+        for dropped in jd_list[MAX_RECENT_JDS:]:
+            self._jd_name_set.discard(dropped.get("name"))
         self._save_config()
+        if self.setup_page_instance:
+            self.setup_page_instance.prepend_recent_jd(new_entry, MAX_RECENT_JDS)
 
     def _setup_ui(self):
         main_window_layout = QVBoxLayout(self)
@@ -349,15 +561,15 @@ class InterviewApp(QWidget):
         self.stacked_widget = QStackedWidget()
         main_window_layout.addWidget(self.stacked_widget, stretch=1)
 
+        # Only the setup page is built up front; the others are built on first navigation
+        # and placeholders keep the indices stable.
         self.setup_page_instance = SetupPage(self)
-        self.interview_page_instance = InterviewPage(self)
-        self.loading_page_instance = LoadingPage(self)
-        self.results_container_instance = ResultsContainerPage(self)
+        self._bind_setup_widgets(self.setup_page_instance)
 
         self.stacked_widget.addWidget(self.setup_page_instance)
-        self.stacked_widget.addWidget(self.interview_page_instance)
-        self.stacked_widget.addWidget(self.loading_page_instance)
-        self.stacked_widget.addWidget(self.results_container_instance)
+        self.stacked_widget.addWidget(QWidget())
+        self.stacked_widget.addWidget(QWidget())
+        self.stacked_widget.addWidget(QWidget())
 
         self.status_bar_label = QLabel("Ready.")
         self.status_bar_label.setObjectName("statusBar")
@@ -369,81 +581,157 @@ class InterviewApp(QWidget):
 
         self.setLayout(main_window_layout)
 
+    def _replace_placeholder_page(self, index: int, page: QWidget):
+        placeholder = self.stacked_widget.widget(index)
+        self.stacked_widget.insertWidget(index, page)
+        if placeholder is not None:
+            self.stacked_widget.removeWidget(placeholder)
+            placeholder.deleteLater()
+
+    def _ensure_interview_page(self):
+        if self.interview_page_instance is None:
+            print("Creating Interview Page...")
+            self.interview_page_instance = InterviewPage(self)
+            self._replace_placeholder_page(self.INTERVIEW_PAGE_INDEX, self.interview_page_instance)
+        return self.interview_page_instance
+
+    def _ensure_loading_page(self):
+        if self.loading_page_instance is None:
+            self.loading_page_instance = LoadingPage(self)
+            self._replace_placeholder_page(self.LOADING_PAGE_INDEX, self.loading_page_instance)
+        return self.loading_page_instance
+
+    def _ensure_results_page(self):
+        if self.results_container_instance is None:
+            print("Creating Results Page...")
+            self.results_container_instance = ResultsContainerPage(self)
+            self._replace_placeholder_page(self.RESULTS_CONTAINER_INDEX, self.results_container_instance)
+        return self.results_container_instance
+
+    def _mark_interview_ui_ready(self, page):
+        self._bind_interview_widgets(page)
+        self._init_button_state_table()
+        self._interview_ui_ready = True
+
+    def _bind_setup_widgets(self, page):
+        self._upload_resume_btn = getattr(page, 'upload_resume_btn', None)
+        self._sidebar_toggle_btn = getattr(page, 'sidebar_toggle_btn', None)
+        self._openai_tts_checkbox = getattr(page, 'openai_tts_checkbox', None)
+        self._num_topics_label = getattr(page, 'num_topics_label', None)
+        self._max_follow_ups_label = getattr(page, 'max_follow_ups_label', None)
+
+    def _bind_interview_widgets(self, page):
+        self._answer_input = getattr(page, 'answer_input', None)
+        self._submit_button = getattr(page, 'submit_button', None)
+        self._webcam_view_label = getattr(page, 'webcam_view_label', None)
+        self._submit_icon = getattr(page, 'submit_icon', QIcon())
+        self._record_icon = getattr(page, 'record_icon', QIcon())
+        self._listening_icon = getattr(page, 'listening_icon', QIcon())
+        self._processing_icon = getattr(page, 'processing_icon', QIcon())
+        assert self._answer_input is not None and self._submit_button is not None, \
+            "InterviewPage is missing its answer input or submit button."
+
+    def _init_button_state_table(self):
+        self._button_state_table = {
+            'listening': ("Listening...", self._listening_icon, False),
+            'processing': ("Processing...", self._processing_icon, False),
+            'idle_speech': ("Record Answer", self._record_icon, True),
+            'idle_submit': ("Submit Answer", self._submit_icon, True),
+        }
+
+    @contextmanager
+    def batch_ui_updates(self):
+        """Defers _update_ui_from_state calls inside the block to a single refresh on the outermost exit."""
+        self._ui_update_depth += 1
+        try:
+            yield
+        finally:
+            self._ui_update_depth -= 1
+            if self._ui_update_depth == 0 and self._ui_update_pending:
+                self._ui_update_pending = False
+                self._update_ui_from_state()
+
     def _update_ui_from_state(self):
+        if self._ui_update_depth:
+            self._ui_update_pending = True
+            return
         print("Updating UI from state...")
-        pdf_loaded = bool(self.pdf_filepath and Path(self.pdf_filepath).exists())
-        jd_loaded = bool(self.job_description_text)
+        updates_were_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            pdf_loaded = self._pdf_loaded_cached
+            jd_loaded = bool(self.job_description_text)
 
-        if self.setup_page_instance:
-            recent_resumes_data = self.config.get("recent_resumes", [])
-            recent_jd_data = self.config.get("recent_job_descriptions", [])
-            self.setup_page_instance.update_widgets_from_state(
-                recent_resumes_data=recent_resumes_data,
-                current_selection_path=self.pdf_filepath,
-                recent_jd_data=recent_jd_data,
-                current_jd_name=self.selected_jd_name
-            )
-            self.setup_page_instance.set_controls_enabled_state(pdf_loaded, jd_loaded)
+            if self.setup_page_instance:
+                recent_resumes_data = self.config.get("recent_resumes", [])
+                recent_jd_data = self.config.get("recent_job_descriptions", [])
+                self.setup_page_instance.update_widgets_from_state(
+                    recent_resumes_data=recent_resumes_data,
+                    current_selection_path=self.pdf_filepath,
+                    recent_jd_data=recent_jd_data,
+                    current_jd_name=self.selected_jd_name
+                )
+                self.setup_page_instance.set_controls_enabled_state(pdf_loaded, jd_loaded)
 
-        current_page_index = self.stacked_widget.currentIndex() if self.stacked_widget else -1
+            current_page_index = self.stacked_widget.currentIndex() if self.stacked_widget else -1
 
-        if self.interview_page_instance and current_page_index != self.INTERVIEW_PAGE_INDEX:
-            self.interview_page_instance.clear_fields()
+            if self.interview_page_instance and current_page_index != self.INTERVIEW_PAGE_INDEX:
+                self.interview_page_instance.clear_fields()
 
-        if self.results_container_instance and current_page_index != self.RESULTS_CONTAINER_INDEX:
-            self.results_container_instance.clear_fields()
+            if self.results_container_instance and current_page_index != self.RESULTS_CONTAINER_INDEX:
+                self.results_container_instance.clear_fields()
 
-        self.update_status("Ready.")
-        self.update_submit_button_text()
-        self._update_progress_indicator()
+            self.update_status("Ready.")
+            self.update_submit_button_text()
+            self._update_progress_indicator()
+        finally:
+            if updates_were_enabled:
+                self.setUpdatesEnabled(True)
+                self.update()
+
+    def _update_progress_indicator(self, immediate: bool = False):
+        self._progress_throttle()
+        if immediate:
+            self._progress_throttle.flush()
 
-    def _update_progress_indicator(self):
+    def _refresh_progress_indicator(self):
         if not self.progress_indicator_label or not self.stacked_widget:
             return
 
-        current_index = self.stacked_widget.currentIndex()
-        current_step_index = -1
-
-        if current_index == self.SETUP_PAGE_INDEX:
-            current_step_index = 0
-        elif current_index == self.INTERVIEW_PAGE_INDEX:
-            current_step_index = 1
-        elif current_index == self.LOADING_PAGE_INDEX:
-            current_step_index = 1
-        elif current_index == self.RESULTS_CONTAINER_INDEX:
-            current_step_index = 2
+        current_step_index = self._page_step_index.get(self.stacked_widget.currentIndex(), -1)
+        if current_step_index == self._progress_step_shown:
+            return
+        self._progress_step_shown = current_step_index
+        self.progress_indicator_label.setText(self._progress_html[current_step_index])
 
+    def _build_progress_html(self):
         steps = ["Step 1: Setup", "Step 2: Interview", "Step 3: Results"]
-        progress_parts = []
-        active_color = QColor("#FFA500").name()
+        active_color = PROGRESS_ACTIVE_COLOR
         inactive_color = self.palette().color(QPalette.ColorRole.WindowText).name()
-
-        for i, step in enumerate(steps):
-            is_active = (i == current_step_index)
-            if is_active:
-                progress_parts.append(
-                    f'<font color="{active_color}"><b>  {step}  </b></font>'
-                )
-            else:
-                progress_parts.append(
-                    f'<font color="{inactive_color}">  {step}  </font>'
-                )
-
         separator = f'<font color="{inactive_color}"> → </font>'
-        self.progress_indicator_label.setText(separator.join(progress_parts))
 
+        progress_html = {}
+        for active in range(-1, len(steps)):
+            progress_html[active] = separator.join(
+                f'<font color="{active_color}"><b>  {step}  </b></font>' if i == active
+                else f'<font color="{inactive_color}">  {step}  </font>'
+                for i, step in enumerate(steps)
+            )
+        return progress_html
 
     def _go_to_setup_page(self):
         print("Navigating to Setup Page and Resetting...")
         self.stop_webcam_feed()
-        self.reset_interview_state(clear_config=True)
-        if self.stacked_widget:
-            self.stacked_widget.setCurrentIndex(self.SETUP_PAGE_INDEX)
+        with self.batch_ui_updates():
+            self.reset_interview_state(clear_config=True)
+            if self.stacked_widget:
+                self.stacked_widget.setCurrentIndex(self.SETUP_PAGE_INDEX)
         self._update_progress_indicator()
         self.update_status("Ready for new interview setup.")
 
     def _go_to_interview_page(self):
         print("Navigating to Interview Page...")
+        self._ensure_interview_page()
         if self.interview_page_instance:
             self.interview_page_instance.clear_fields()
             self.interview_page_instance.set_input_mode(self.use_speech_input)
@@ -462,9 +750,9 @@ class InterviewApp(QWidget):
         self.stop_webcam_feed()
         self.update_status("Generating results...")
         if self.stacked_widget:
+            self._ensure_loading_page()
             self.stacked_widget.setCurrentIndex(self.LOADING_PAGE_INDEX)
         self._update_progress_indicator()
-        QApplication.processEvents()
 
     def _go_to_results_page(self, summary: str | None,
                             assessment_data: dict | None,
@@ -476,6 +764,7 @@ class InterviewApp(QWidget):
         self.last_content_score_data = content_score_data
         self.last_average_speech_score = avg_speech_score
 
+        self._ensure_results_page()
         if self.results_container_instance:
             self.results_container_instance.display_results(
                 summary,
@@ -483,16 +772,17 @@ class InterviewApp(QWidget):
                 content_score_data,
                 avg_speech_score
             )
+            self._results_ready = True
         else:
              print("Error: Results container instance not found.")
              self.show_message_box("error", "UI Error", "Results page could not be loaded.")
 
         if self.stacked_widget:
             self.stacked_widget.setCurrentIndex(self.RESULTS_CONTAINER_INDEX)
-        self._update_progress_indicator()
+        self._update_progress_indicator(immediate=True)
         self.update_status("Interview complete. Results displayed.")
 
-    def show_message_box(self, level: str, title: str, message: str):
+    def show_message_box(self, level: str, title: str, message: str, modal: bool = True):
         box = QMessageBox(self)
         icon_map = {
             "info": QMessageBox.Icon.Information,
@@ -503,7 +793,13 @@ class InterviewApp(QWidget):
         box.setWindowTitle(title)
         box.setText(message)
         box.setStandardButtons(QMessageBox.StandardButton.Ok)
-        box.exec()
+        if modal:
+            box.exec()
+            return
+        # Non-blocking: the event loop (STT/TTS results, timers) keeps running while it is shown.
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.setModal(False)
+        box.show()
 
     def _adjust_value(self, value_type: str, amount: int):
         current_val = 0
@@ -518,14 +814,14 @@ class InterviewApp(QWidget):
              return
 
         if value_type == 'topics':
-            target_label_widget = getattr(self.setup_page_instance, 'num_topics_label', None)
+            target_label_widget = self._num_topics_label
             current_val = self.num_topics
             min_val = logic.MIN_TOPICS
             max_val = logic.MAX_TOPICS
             target_var_name = 'num_topics'
             font_to_apply = getattr(self, 'font_default_xxl', None)
         elif value_type == 'followups':
-            target_label_widget = getattr(self.setup_page_instance, 'max_follow_ups_label', None)
+            target_label_widget = self._max_follow_ups_label
             current_val = self.max_follow_ups
             min_val = logic.MIN_FOLLOW_UPS
             max_val = logic.MAX_FOLLOW_UPS_LIMIT
@@ -550,16 +846,19 @@ class InterviewApp(QWidget):
              print(f"Value for {value_type} already at {limit_type} limit ({clamped_value}).")
 
     def update_status(self, message: str, busy: bool = False):
-        if self.status_bar_label:
+        if self.status_bar_label and self.status_bar_label.text() != message:
             self.status_bar_label.setText(message)
+        self._set_busy_cursor(busy)
 
+    def _set_busy_cursor(self, busy: bool):
         if busy:
-            QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
-        else:
-            if QApplication.overrideCursor() is not None:
-                 QApplication.restoreOverrideCursor()
-
-        QApplication.processEvents()
+            if self._busy_override_depth == 0:
+                QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
+                self._busy_override_depth = 1
+            return
+        while self._busy_override_depth > 0:
+            QApplication.restoreOverrideCursor()
+            self._busy_override_depth -= 1
 
     def display_question(self, question_text: str):
         self.last_question_asked = question_text
@@ -587,41 +886,47 @@ class InterviewApp(QWidget):
         else:
             self.update_status(f"Asking: {question_text[:30]}...")
 
-        try:
-            tts.speak_text(question_text)
-        except Exception as e:
-            print(f"TTS Error during speak_text call: {e}")
-            self.show_message_box("warning", "TTS Error", f"Could not speak the question: {e}")
+        self._speak_async(question_text, report_errors=True)
 
         self.enable_interview_controls()
-        answer_input = getattr(self.interview_page_instance, 'answer_input', None)
-        if answer_input and not self.use_speech_input:
-            answer_input.setFocus()
+        if self._interview_ui_ready and not self.use_speech_input:
+            self._answer_input.setFocus()
 
-    def add_to_history(self, text: str, tag: str = None):
-        log_prefix = "HISTORY [I]: "
-        if tag == "question_style":
-            log_prefix = "HISTORY [Q]: "
-        elif tag == "answer_style":
-            log_prefix = "HISTORY [A]: "
-        elif tag == "topic_marker":
-            log_prefix = "HISTORY [T]: "
+    def _speak_async(self, text: str, report_errors: bool = False):
+        worker = Worker(tts.speak_text, text)
+        if report_errors:
+            worker.signals.error.connect(self._on_tts_error)
+        self._tts_pool.start(worker)
+
+    def _on_tts_error(self, error_message):
+        print(f"TTS Error during speak_text call: {error_message}")
+        self.show_message_box("warning", "TTS Error", f"Could not speak the question: {error_message}", modal=False)
 
+    def add_to_history(self, text: str, tag: str = None):
+        log_prefix = _HISTORY_LOG_PREFIXES.get(tag, _HISTORY_DEFAULT_PREFIX)
         cleaned_text = text.strip()
         print(f"{log_prefix}{cleaned_text}")
 
+    def add_qa_pair(self, question: str, answer: str, topic_marker: str = None):
+        lines = []
+        if topic_marker:
+            lines.append(f"{_HISTORY_LOG_PREFIXES['topic_marker']}{topic_marker.strip()}")
+        lines.append(f"{_HISTORY_LOG_PREFIXES['question_style']}Q: {question.strip()}")
+        lines.append(f"{_HISTORY_LOG_PREFIXES['answer_style']}A: {answer.strip()}")
+        print("\n".join(lines))
+
     def set_setup_controls_state(self, pdf_loaded: bool, jd_loaded: bool = False):
         if self.setup_page_instance:
             self.setup_page_instance.set_controls_enabled_state(pdf_loaded, jd_loaded)
 
     def enable_interview_controls(self):
-        if self.interview_page_instance:
+        if self._interview_ui_ready:
             self.interview_page_instance.set_controls_enabled(True)
             self.is_recording = False
             self.set_recording_button_state('idle')
 
     def disable_interview_controls(self, is_recording_stt: bool = False):
-        if self.interview_page_instance:
+        if self._interview_ui_ready:
             self.interview_page_instance.set_controls_enabled(False, is_recording_stt)
             self.is_recording = is_recording_stt
 
@@ -637,6 +942,7 @@ class InterviewApp(QWidget):
             self.use_speech_input = False
             self.use_openai_tts = False
 
+        if clear_config and self._tts_provider_dirty:
             current_provider = tts.get_current_provider()
             default_provider = tts.DEFAULT_PROVIDER
             print(f"Resetting TTS. Current: {current_provider}, Default: {default_provider}")
@@ -652,9 +958,12 @@ class InterviewApp(QWidget):
                     print(f"Reset TTS: Set to default '{default_provider}'.")
             else:
                  print("Reset TTS: Already using default provider.")
+            self._tts_provider_dirty = False
 
         self.initial_questions = []
-        self.cleaned_initial_questions = set()
+        self.cleaned_initial_questions = frozenset()
+        self._cleaned_initial_questions_list = []
+        self._initial_topic_index = {}
         self.current_initial_q_index = -1
         self.current_topic_question = ""
         self.current_topic_history = []
@@ -665,98 +974,90 @@ class InterviewApp(QWidget):
         self.last_assessment_data = None
         self.last_content_score_data = None
         self.last_average_speech_score = 0.0
+        self._results_ready = False
+        self._pending_topic_marker = None
 
         self.current_speech_score_sum = 0.0
         self.current_speech_score_count = 0.0
 
-        self._update_ui_from_state()
-        self.disable_interview_controls()
-        if QApplication.overrideCursor() is not None:
-            QApplication.restoreOverrideCursor()
+        self._pending_follow_up_signals = None
+        self._filler_timer.stop()
+
+        updates_were_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_ui_from_state()
+            self.disable_interview_controls()
+        finally:
+            if updates_were_enabled:
+                self.setUpdatesEnabled(True)
+                self.update()
+        self._set_busy_cursor(False)
         print("Interview state reset complete.")
 
-    def _clean_question_text(self, raw_q_text: str) -> str:
-        cleaned = raw_q_text.strip()
-        if cleaned and cleaned[0].isdigit():
-            match = re.match(r"^\d{1,2}[\.\)\s]+(.*)", cleaned)
-            if match:
-                return match.group(1).strip()
-        return cleaned
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _clean_question_text(raw_q_text: str) -> str:
+        return _LEADING_NUM_RE.sub("", raw_q_text.strip(), count=1)
+
+    def _refresh_topic_index(self):
+        self._cleaned_initial_questions_list = [
+            self._clean_question_text(q) for q in self.initial_questions or []
+        ]
+        self._initial_topic_index = {
+            q: i for i, q in enumerate(self._cleaned_initial_questions_list)
+        }
+        self.cleaned_initial_questions = frozenset(self._initial_topic_index)
 
     def _clear_recordings_folder(self):
-        recordings_path = Path(RECORDINGS_DIR)
+        # Old recordings can be large; delete them off the UI thread. Nothing is recorded
+        # until the initial questions are back, so this can run alongside their generation.
+        worker = Worker(self._clear_recordings_dir, self._recordings_path)
+        worker.signals.error.connect(self._on_clear_recordings_error)
+        QThreadPool.globalInstance().start(worker)
+
+    @staticmethod
+    def _clear_recordings_dir(recordings_path: Path):
         print(f"Attempting to clear recordings folder: {recordings_path}")
-        if recordings_path.exists() and recordings_path.is_dir():
-            try:
-                for item_path in recordings_path.iterdir():
-                    try:
-                        if item_path.is_file():
-                            os.remove(item_path)
-                            print(f"  Deleted file: {item_path.name}")
-                        elif item_path.is_dir():
-                            shutil.rmtree(item_path)
-                            print(f"  Deleted directory: {item_path.name}")
-                    except OSError as e:
-                        print(f"  Error deleting {item_path}: {e}")
-                print("Recordings folder cleared successfully.")
-            except Exception as e:
-                print(f"Error iterating or clearing recordings folder {recordings_path}: {e}")
-                self.show_message_box("error", "Cleanup Error", f"Could not clear recordings folder:\n{recordings_path}\n\n{e}")
+        if recordings_path.is_dir():
+            # Snapshot first so files created once the new interview starts are left alone.
+            for item_path in list(recordings_path.iterdir()):
+                try:
+                    if item_path.is_file():
+                        os.remove(item_path)
+                        print(f"  Deleted file: {item_path.name}")
+                    elif item_path.is_dir():
+                        shutil.rmtree(item_path)
+                        print(f"  Deleted directory: {item_path.name}")
+                except OSError as e:
+                    print(f"  Error deleting {item_path}: {e}")
+            print("Recordings folder cleared successfully.")
         else:
             print(f"Recordings folder does not exist or is not a directory: {recordings_path}")
-            try:
-                recordings_path.mkdir(parents=True, exist_ok=True)
-            except OSError as e:
-                 print(f"CRITICAL ERROR: Could not create recordings directory: {e}")
-                 self.show_message_box(
-                    "error",
-                    "Directory Error",
-                    f"Could not create necessary recordings directory:\n{recordings_path}"
-                 )
+            recordings_path.mkdir(parents=True, exist_ok=True)
+
+    def _on_clear_recordings_error(self, error_message):
+        self.show_message_box(
+            "error", "Cleanup Error",
+            f"Could not clear recordings folder:\n{self._recordings_path}\n\n{error_message}",
+            modal=False
+        )
 
     def save_transcript_to_file(self):
         if not self.current_full_interview_history:
             print("No interview history to save.")
             return
 
-        topic_index_map = {}
-        if self.initial_questions:
-            topic_index_map = {
-                self._clean_question_text(q): i for i, q in enumerate(self.initial_questions)
-            }
-        else:
+        if not self._initial_topic_index:
             print("Warning: Initial questions missing, cannot map topics accurately for transcript.")
 
-        transcript_lines = []
-        last_topic_num = -1
-
         try:
-            for qa_pair in self.current_full_interview_history:
-                q_raw = qa_pair.get('q', 'N/A')
-                a = qa_pair.get('a', 'N/A')
-                q_clean = self._clean_question_text(q_raw)
-
-                topic_index = topic_index_map.get(q_clean, -1)
-
-                if topic_index != -1:
-                    current_topic_num = topic_index + 1
-                    if current_topic_num != last_topic_num and last_topic_num != -1:
-                        transcript_lines.append("\n-------------------------")
-                    transcript_lines.append(f"\nQuestion {current_topic_num}: {q_raw}\nAnswer: {a}")
-                    last_topic_num = current_topic_num
-                else:
-                    context = f"Topic {last_topic_num}" if last_topic_num > 0 else "General"
-                    transcript_lines.append(f"\nFollow Up (re {context}): {q_raw}\nAnswer: {a}")
-
-            recordings_path = Path(RECORDINGS_DIR)
-            os.makedirs(recordings_path, exist_ok=True)
-            filepath = recordings_path / "transcript.txt"
+            recording.ensure_recordings_dir()
+            filepath = self._recordings_path / "transcript.txt"
             print(f"Saving transcript to {filepath}...")
 
-            final_transcript = "\n".join(line.strip() for line in transcript_lines if line.strip())
-
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(final_transcript.strip() + "\n")
+            with open(filepath, "w", encoding="utf-8", buffering=1 << 16) as f:
+                f.writelines(self._iter_transcript_lines())
 
             print("Transcript saved.")
             self.update_status(f"Transcript saved to {filepath.name}")
@@ -765,70 +1066,66 @@ class InterviewApp(QWidget):
             print(f"Error saving transcript: {e}")
             self.show_message_box("error", "File Save Error", f"Could not save transcript:\n{e}")
 
-    def set_recording_button_state(self, state: str):
-        if not self.interview_page_instance: return
-        target_button = getattr(self.interview_page_instance, 'submit_button', None)
-        if not target_button: return
-
-        submit_icon = getattr(self.interview_page_instance, 'submit_icon', QIcon())
-        record_icon = getattr(self.interview_page_instance, 'record_icon', QIcon())
-        listening_icon = getattr(self.interview_page_instance, 'listening_icon', QIcon())
-        processing_icon = getattr(self.interview_page_instance, 'processing_icon', QIcon())
-
-        target_icon = QIcon()
-        target_text = "Submit Answer"
-        enabled = True
-
-        if state == 'listening':
-            target_text = "Listening..."
-            target_icon = listening_icon
-            enabled = False
-        elif state == 'processing':
-            target_text = "Processing..."
-            target_icon = processing_icon
-            enabled = False
-        elif state == 'idle':
-            enabled = True
-            if self.use_speech_input:
-                target_text = "Record Answer"
-                target_icon = record_icon
-            else:
-                target_text = "Submit Answer"
-                target_icon = submit_icon
-        else:
-            print(f"Warning: Unknown recording button state '{state}'. Defaulting to idle.")
-            enabled = True
-            if self.use_speech_input:
-                target_text = "Record Answer"
-                target_icon = record_icon
+    def _iter_transcript_lines(self):
+        topic_index_map = self._initial_topic_index
+        last_topic_num = -1
+        for qa_pair in self.current_full_interview_history:
+            q_raw = qa_pair.get('q', 'N/A').strip()
+            a = qa_pair.get('a', 'N/A').strip()
+            q_clean = qa_pair.get('q_clean')
+            if q_clean is None:
+                q_clean = self._clean_question_text(q_raw)
+
+            topic_index = topic_index_map.get(q_clean, -1)
+
+            if topic_index != -1:
+                current_topic_num = topic_index + 1
+                if current_topic_num != last_topic_num and last_topic_num != -1:
+                    yield "-------------------------\n"
+                yield f"Question {current_topic_num}: {q_raw}\nAnswer: {a}\n"
+                last_topic_num = current_topic_num
             else:
-                target_text = "Submit Answer"
-                target_icon = submit_icon
+                context = f"Topic {last_topic_num}" if last_topic_num > 0 else "General"
+                yield f"Follow Up (re {context}): {q_raw}\nAnswer: {a}\n"
+
+    def set_recording_button_state(self, state: str):
+        if not self._interview_ui_ready: return
+        target_button = self._submit_button
+
+        if state not in ('listening', 'processing'):
+            if state != 'idle':
+                print(f"Warning: Unknown recording button state '{state}'. Defaulting to idle.")
+            state = 'idle_speech' if self.use_speech_input else 'idle_submit'
+        target_text, target_icon, enabled = self._button_state_table[state]
 
         target_button.setText(target_text)
         target_button.setEnabled(enabled)
         if target_icon and not target_icon.isNull():
             target_button.setIcon(target_icon)
-            target_button.setIconSize(getattr(self, 'icon_size', QSize(24, 24)))
         else:
             target_button.setIcon(QIcon())
 
     def _process_selected_resume(self, resume_data: dict):
+        if self._pending_resume is not None:
+            self.update_status("Still loading the previous resume...")
+            return
         original_filepath = resume_data.get("path")
         preferred_name = resume_data.get("name")
 
-        if not original_filepath or not Path(original_filepath).exists():
+        original_path = Path(original_filepath) if original_filepath else None
+        if not original_path or not original_path.exists():
             self.show_message_box("error", "File Error", f"Selected file not found:\n{original_filepath}")
+            with self.batch_ui_updates():
+                recent_list = self.config.get("recent_resumes", [])
+                updated_list = [item for item in recent_list if item.get("path") != original_filepath]
+                if len(updated_list) < len(recent_list):
+                    self.config["recent_resumes"] = updated_list
+                    self._save_config()
+                    self._update_ui_from_state()
             self.update_status("Selected resume not found.")
-            recent_list = self.config.get("recent_resumes", [])
-            updated_list = [item for item in recent_list if item.get("path") != original_filepath]
-            if len(updated_list) < len(recent_list):
-                self.config["recent_resumes"] = updated_list
-                self._save_config()
-                self._update_ui_from_state()
             return
 
-        filename = Path(original_filepath).name
+        filename = original_path.name
         target_filepath = self.resumes_dir / filename
         managed_path_str = str(target_filepath)
         custom_name = preferred_name
@@ -836,15 +1133,17 @@ class InterviewApp(QWidget):
         needs_name_prompt = not custom_name
 
         try:
-            if target_filepath.exists() and os.path.samefile(original_filepath, managed_path_str):
+            if original_path.resolve() == target_filepath.resolve():
                 needs_copy = False
                 print(f"File '{filename}' is already managed and identical.")
                 if not custom_name:
-                    for item in self.config.get("recent_resumes", []):
-                        if item.get("path") == managed_path_str:
-                            custom_name = item.get("name")
-                            print(f"Found existing name in config: '{custom_name}'")
-                            break
+                    name_by_path = {
+                        item.get("path"): item.get("name")
+                        for item in self.config.get("recent_resumes", [])
+                    }
+                    custom_name = name_by_path.get(managed_path_str)
+                    if custom_name:
+                        print(f"Found existing name in config: '{custom_name}'")
                     needs_name_prompt = not custom_name
                 else:
                     needs_name_prompt = False
@@ -857,7 +1156,7 @@ class InterviewApp(QWidget):
             needs_name_prompt = not custom_name
 
         if needs_name_prompt:
-            suggested_name = Path(filename).stem.replace('_', ' ').replace('-', ' ').title()
+            suggested_name = original_path.stem.replace('_', ' ').replace('-', ' ').title()
             name, ok = QInputDialog.getText(
                 self, "Name Resume", "Enter a display name for this resume:",
                 QLineEdit.EchoMode.Normal, suggested_name
@@ -869,12 +1168,13 @@ class InterviewApp(QWidget):
                 return
 
         if not custom_name:
-            custom_name = Path(filename).stem
+            custom_name = original_path.stem
 
         if needs_copy:
             try:
                 print(f"Copying '{original_filepath}' to '{target_filepath}'...")
-                shutil.copy2(original_filepath, target_filepath)
+                self._ensure_dir(self.resumes_dir)
+                shutil.copyfile(original_filepath, target_filepath)
                 print("Copy successful.")
             except (IOError, OSError, shutil.Error) as e:
                 print(f"Error copying resume file: {e}")
@@ -883,9 +1183,25 @@ class InterviewApp(QWidget):
                 return
 
         self.update_status(f"Loading resume '{custom_name}'...", True)
-        QApplication.processEvents()
-        extracted_content = logic.extract_text_from_pdf(managed_path_str)
+        self._pending_resume = (managed_path_str, custom_name, filename)
+        if self._upload_resume_btn:
+            self._upload_resume_btn.setEnabled(False)
+        worker = Worker(logic.extract_text_from_pdf, managed_path_str)
+        worker.signals.finished.connect(self._on_resume_extracted)
+        worker.signals.error.connect(self._on_resume_extraction_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_resume_extraction_error(self, error_message):
+        self._on_resume_extracted(None)
+
+    def _on_resume_extracted(self, extracted_content):
+        if self._pending_resume is None:
+            return
+        managed_path_str, custom_name, filename = self._pending_resume
+        self._pending_resume = None
         self.update_status("", False)
+        if self._upload_resume_btn:
+            self._upload_resume_btn.setEnabled(True)
 
         if extracted_content is None:
             self.show_message_box("error", "PDF Error", f"Failed to extract text from '{filename}'.")
@@ -909,67 +1225,85 @@ class InterviewApp(QWidget):
             self.setup_page_instance.show_resume_selection_state(managed_path_str)
 
     def _handle_openai_tts_change(self, check_state_value: int):
-        checkbox = getattr(self.setup_page_instance, 'openai_tts_checkbox', None)
+        checkbox = self._openai_tts_checkbox
         is_checked = (check_state_value == Qt.CheckState.Checked.value)
         target_provider = "openai" if is_checked else tts.DEFAULT_PROVIDER
         print(f"OpenAI TTS change detected. Target provider: '{target_provider}'")
 
+        # Provider setup (keyring lookup, client init) runs off the UI thread; the checkbox
+        # stays disabled until the result is back so toggles can't overlap.
+        self._tts_provider_dirty = True
         if checkbox:
-            checkbox.blockSignals(True)
-
-        success = tts.set_provider(target_provider)
+            checkbox.setEnabled(False)
+        self.update_status(f"Switching TTS provider to '{target_provider}'...", True)
+        worker = Worker(self._select_tts_provider, target_provider)
+        worker.signals.finished.connect(
+            lambda result: self._on_tts_provider_selected(is_checked, target_provider, result)
+        )
+        worker.signals.error.connect(
+            lambda _msg: self._on_tts_provider_selected(is_checked, target_provider, (False, False))
+        )
+        QThreadPool.globalInstance().start(worker)
+
+    @staticmethod
+    def _select_tts_provider(target_provider):
+        """Returns (target_set, any_provider_set), trying the default and first available on failure."""
+        if tts.set_provider(target_provider):
+            return True, True
+        print(f"Failed to set provider '{target_provider}'. Attempting fallback...")
+        if target_provider != tts.DEFAULT_PROVIDER and tts.set_provider(tts.DEFAULT_PROVIDER):
+            print(f"Fallback to default provider '{tts.DEFAULT_PROVIDER}' succeeded.")
+            return False, True
+        potential = tts.get_potentially_available_providers()
+        final_fallback = potential[0] if potential else None
+        if final_fallback and tts.set_provider(final_fallback):
+            print(f"Fallback to first available '{final_fallback}' succeeded.")
+            return False, True
+        return False, False
+
+    def _on_tts_provider_selected(self, is_checked, target_provider, result):
+        success, fallback_success = result
+        checkbox = self._openai_tts_checkbox
+        current_provider = tts.get_current_provider()
+        self._set_busy_cursor(False)
+        if checkbox:
+            checkbox.setEnabled(True)
 
         if success:
             self.use_openai_tts = is_checked
-            current_provider = tts.get_current_provider()
             self.update_status(f"TTS Provider set to: {current_provider}")
             print(f"Successfully set TTS provider to: {current_provider}")
-        else:
-            self.use_openai_tts = False
-            if is_checked and checkbox:
-                checkbox.setChecked(False)
-            print(f"Failed to set provider '{target_provider}'. Attempting fallback...")
-
-            fallback_success = False
-            if target_provider != tts.DEFAULT_PROVIDER:
-                if tts.set_provider(tts.DEFAULT_PROVIDER):
-                     print(f"Fallback to default provider '{tts.DEFAULT_PROVIDER}' succeeded.")
-                     fallback_success = True
-
-            if not fallback_success:
-                 potential = tts.get_potentially_available_providers()
-                 final_fallback = potential[0] if potential else None
-                 if final_fallback and tts.set_provider(final_fallback):
-                     print(f"Fallback to first available '{final_fallback}' succeeded.")
-                     fallback_success = True
+            return
 
-            current_provider = tts.get_current_provider()
-            if not fallback_success:
-                 print("ERROR: Failed to set any TTS provider.")
-                 self.show_message_box("error", "TTS Error", "Failed to set any TTS provider.")
-                 if checkbox:
-                     checkbox.setEnabled(False)
-                     checkbox.setToolTip("TTS provider error. Check console.")
-                 status_msg = f"Error setting TTS: No provider available"
-            else:
-                 status_msg = f"Failed to set '{target_provider}'. Using: {current_provider}"
+        self.use_openai_tts = False
+        if is_checked and checkbox:
+            checkbox.blockSignals(True)
+            checkbox.setChecked(False)
+            checkbox.blockSignals(False)
 
-            self.update_status(status_msg)
+        if not fallback_success:
+             print("ERROR: Failed to set any TTS provider.")
+             self.show_message_box("error", "TTS Error", "Failed to set any TTS provider.")
+             if checkbox:
+                 checkbox.setEnabled(False)
+                 checkbox.setToolTip("TTS provider error. Check console.")
+             status_msg = f"Error setting TTS: No provider available"
+        else:
+             status_msg = f"Failed to set '{target_provider}'. Using: {current_provider}"
 
-            if is_checked and not success:
-                keyring_info = "(Check if API key is correctly stored in keyring)"
-                try:
-                    openai_provider_info = tts.tts_providers.get('openai')
-                    if openai_provider_info and hasattr(openai_provider_info, 'KEYRING_SERVICE_NAME_OPENAI'):
-                         keyring_info = f"(Service: '{openai_provider_info.KEYRING_SERVICE_NAME_OPENAI}')"
-                except Exception: pass
-                self.show_message_box(
-                    "warning", "OpenAI TTS Failed",
-                    f"Could not enable OpenAI TTS.\n{keyring_info}\n\nUsing fallback: {current_provider or 'None'}"
-                )
+        self.update_status(status_msg)
 
-        if checkbox:
-            checkbox.blockSignals(False)
+        if is_checked:
+            keyring_info = "(Check if API key is correctly stored in keyring)"
+            try:
+                openai_provider_info = tts.tts_providers.get('openai')
+                if openai_provider_info and hasattr(openai_provider_info, 'KEYRING_SERVICE_NAME_OPENAI'):
+                     keyring_info = f"(Service: '{openai_provider_info.KEYRING_SERVICE_NAME_OPENAI}')"
+            except Exception: pass
+            self.show_message_box(
+                "warning", "OpenAI TTS Failed",
+                f"Could not enable OpenAI TTS.\n{keyring_info}\n\nUsing fallback: {current_provider or 'None'}"
+            )
 
     def update_submit_button_text(self, check_state_value: int = None):
         if check_state_value is not None:
@@ -987,35 +1321,49 @@ class InterviewApp(QWidget):
         if not self.is_recording:
             self.set_recording_button_state('idle')
 
-        answer_input = getattr(self.interview_page_instance, 'answer_input', None)
-        if answer_input:
-            is_text_mode = not self.use_speech_input
+        # Several state transitions can request this in one event-loop pass; refresh the input once.
+        if not self._submit_refresh_pending:
+            self._submit_refresh_pending = True
+            QTimer.singleShot(0, self._apply_answer_input_state)
 
-            submit_btn = getattr(self.interview_page_instance, 'submit_button', None)
-            controls_generally_active = submit_btn and submit_btn.isEnabled() and not self.is_recording
+    def _apply_answer_input_state(self):
+        self._submit_refresh_pending = False
+        if self._interview_ui_ready:
+            answer_input = self._answer_input
+            is_text_mode = not self.use_speech_input
 
-            answer_input.setEnabled(is_text_mode and controls_generally_active)
-            answer_input.setReadOnly(not is_text_mode)
+            controls_generally_active = self._submit_button.isEnabled() and not self.is_recording
 
-            if is_text_mode and controls_generally_active:
-                answer_input.setPlaceholderText("Type your answer here...")
-                if self.stacked_widget and self.stacked_widget.currentIndex() == self.INTERVIEW_PAGE_INDEX:
-                    answer_input.setFocus()
-            elif not is_text_mode:
-                if self.interview_page_instance.webcam_view_label.pixmap() is None or \
-                   self.interview_page_instance.webcam_view_label.pixmap().isNull():
-                     answer_input.setPlaceholderText("Webcam view loading (STT Mode)...")
+            # One repaint and no intermediate signals for the whole state burst.
+            blocker = QSignalBlocker(answer_input)
+            answer_input.setUpdatesEnabled(False)
+            try:
+                answer_input.setEnabled(is_text_mode and controls_generally_active)
+                answer_input.setReadOnly(not is_text_mode)
+
+                if is_text_mode and controls_generally_active:
+                    answer_input.setPlaceholderText("Type your answer here...")
+                elif not is_text_mode:
+                    webcam_pixmap = self._webcam_view_label.pixmap() if self._webcam_view_label else None
+                    if webcam_pixmap is None or webcam_pixmap.isNull():
+                         answer_input.setPlaceholderText("Webcam view loading (STT Mode)...")
+                    else:
+                         answer_input.setPlaceholderText("Webcam view active (STT Mode)...")
                 else:
-                     answer_input.setPlaceholderText("Webcam view active (STT Mode)...")
-            else:
-                answer_input.setPlaceholderText("Waiting for question or processing...")
+                    answer_input.setPlaceholderText("Waiting for question or processing...")
+            finally:
+                answer_input.setUpdatesEnabled(True)
+                blocker.unblock()
+
+            if (is_text_mode and controls_generally_active and self.stacked_widget
+                    and self.stacked_widget.currentIndex() == self.INTERVIEW_PAGE_INDEX):
+                answer_input.setFocus()
 
 
     def select_resume_file(self):
-        start_dir = os.path.expanduser("~")
-        start_dir_native = os.path.normpath(start_dir)
         filepath, _ = QFileDialog.getOpenFileName(
-            self, "Select New Resume PDF", start_dir_native, "PDF Files (*.pdf)"
+            self, "Select New Resume PDF", _HOME_DIR, "PDF Files (*.pdf)",
+            options=QFileDialog.Option.ReadOnly | QFileDialog.Option.DontResolveSymlinks
         )
         if filepath:
             self._process_selected_resume({"path": filepath, "name": None})
@@ -1046,8 +1394,7 @@ class InterviewApp(QWidget):
             if ok_name and name and name.strip():
                 name = name.strip()
 
-                existing_names = [item.get("name") for item in self.config.get("recent_job_descriptions", [])]
-                if name in existing_names:
+                if name in self._jd_name_set:
                     reply = QMessageBox.question(
                         self, 'Overwrite JD?',
                         f"A job description named '{name}' already exists. Overwrite it?",
@@ -1058,10 +1405,12 @@ class InterviewApp(QWidget):
                         self.update_status(f"Job description '{name}' not overwritten.")
                         return
 
-                self._add_recent_jd(name, jd_text)
                 self.selected_jd_name = name
                 self.job_description_text = jd_text
-                self._update_ui_from_state()
+                self._add_recent_jd(name, jd_text)
+                if self.setup_page_instance:
+                    self.setup_page_instance.show_jd_selection_state(name)
+                self.set_setup_controls_state(bool(self.pdf_filepath), True)
                 self.update_status(f"Job description '{name}' added and selected.")
             else:
                 self.update_status("Job description add cancelled (no name provided).")
@@ -1076,15 +1425,16 @@ class InterviewApp(QWidget):
         text = jd_data.get("text")
         print(f"JDWidget selected: {name}")
         if name and text is not None:
-            self.selected_jd_name = name
-            self.job_description_text = text
-            self._update_ui_from_state()
+            with self.batch_ui_updates():
+                self.selected_jd_name = name
+                self.job_description_text = text
+                self._update_ui_from_state()
             self.update_status(f"Job description '{name}' selected.")
         else:
             print("Warning: Received invalid data from JDWidget click.")
             self.show_message_box("warning", "Internal Error", "Invalid data received from JD list.")
 
-    def start_interview_process(self):
+    def start_interview_process(self, *, force_refresh=False):
         if not self.pdf_filepath or not self.resume_content:
             self.show_message_box("warning", "Input Missing", "Please select a resume PDF first.")
             return
@@ -1092,12 +1442,14 @@ class InterviewApp(QWidget):
             self.show_message_box("warning", "Input Missing", "Please select or add a Job Description first.")
             return
 
-        current_jd_text = self.job_description_text
-
-        if self.use_openai_tts and "openai" not in tts.get_runtime_available_providers():
+        if self.use_openai_tts and not tts.is_runtime_available("openai"):
             self.show_message_box("error", "TTS Error", "OpenAI TTS selected but unavailable. Please check API key or select another TTS option.")
             return
 
+        fresh_questions_box = getattr(self.setup_page_instance, 'fresh_questions_checkbox', None)
+        if fresh_questions_box is not None and fresh_questions_box.isChecked():
+            force_refresh = True
+
         print("-" * 20)
         print(f"Preparing Interview:")
         print(f"  Resume: {Path(self.pdf_filepath).name if self.pdf_filepath else 'N/A'}")
@@ -1106,36 +1458,46 @@ class InterviewApp(QWidget):
         print(f"  Max Follow-ups: {self.max_follow_ups}")
         print(f"  STT Enabled: {self.use_speech_input}")
         print(f"  OpenAI TTS Enabled: {self.use_openai_tts}")
+        print(f"  Skip LLM Cache: {force_refresh}")
         print("-" * 20)
 
         self.reset_interview_state(clear_config=False)
+        self.force_llm_refresh = force_refresh
 
         self._clear_recordings_folder()
 
         self.update_status(f"Generating {self.num_topics} initial questions...", True)
-        pdf_loaded = bool(self.pdf_filepath)
-        jd_loaded = bool(self.job_description_text)
         self.set_setup_controls_state(False, False)
-        toggle_btn = getattr(self.setup_page_instance, 'sidebar_toggle_btn', None)
-        if toggle_btn:
-            toggle_btn.setEnabled(False)
-        QApplication.processEvents()
+        if self._sidebar_toggle_btn:
+            self._sidebar_toggle_btn.setEnabled(False)
+
+        worker = Worker(
+            logic.generate_initial_questions,
+            resume_text=self.resume_content,
+            job_desc_text=self.job_description_text,
+            num_questions=self.num_topics,
+            force_refresh=self.force_llm_refresh
+        )
+        worker.signals.finished.connect(self._on_initial_questions_ready)
+        worker.signals.error.connect(self._on_initial_questions_error)
+        QThreadPool.globalInstance().start(worker)
 
-        try:
-            self.initial_questions = logic.generate_initial_questions(
-                resume_text=self.resume_content,
-                job_desc_text=current_jd_text,
-                num_questions=self.num_topics
-            )
-        except Exception as e:
-            print(f"ERROR generating initial questions: {e}")
-            self.initial_questions = None
-            self.show_message_box("error", "Generation Error", f"Failed to generate interview questions:\n{e}")
-        finally:
-            self.update_status("", False)
-            self.set_setup_controls_state(pdf_loaded, jd_loaded)
-            if toggle_btn:
-                toggle_btn.setEnabled(True)
+    def _restore_setup_controls(self):
+        self.update_status("", False)
+        self.set_setup_controls_state(bool(self.pdf_filepath), bool(self.job_description_text))
+        if self._sidebar_toggle_btn:
+            self._sidebar_toggle_btn.setEnabled(True)
+
+    def _on_initial_questions_error(self, error_message):
+        print(f"ERROR generating initial questions: {error_message}")
+        self.initial_questions = None
+        self._restore_setup_controls()
+        self.show_message_box("error", "Generation Error", f"Failed to generate interview questions:\n{error_message}")
+        self.update_status("Error generating interview questions.")
+
+    def _on_initial_questions_ready(self, questions):
+        self.initial_questions = questions
+        self._restore_setup_controls()
 
         if not self.initial_questions:
             self.update_status("Error generating interview questions.")
@@ -1143,9 +1505,7 @@ class InterviewApp(QWidget):
             return
 
         print(f"Generated {len(self.initial_questions)} initial questions.")
-        self.cleaned_initial_questions = {
-            self._clean_question_text(q) for q in self.initial_questions
-        }
+        self._refresh_topic_index()
         if len(self.initial_questions) < self.num_topics:
             print(f"Warning: Received {len(self.initial_questions)} questions "
                   f"(requested {self.num_topics}). Continuing with available questions.")
@@ -1165,14 +1525,15 @@ class InterviewApp(QWidget):
             self.follow_up_count = 0
             self.current_topic_history = []
             raw_q_text = self.initial_questions[self.current_initial_q_index]
-            self.current_topic_question = self._clean_question_text(raw_q_text)
+            self.current_topic_question = self._cleaned_initial_questions_list[self.current_initial_q_index]
 
             topic_marker = (
                 f"\n--- Topic {self.current_initial_q_index + 1}"
                 f"/{len(self.initial_questions)} ---"
             )
             print(topic_marker.strip())
-            self.add_to_history(topic_marker, tag="topic_marker")
+            # Emitted with the topic's first Q/A pair so each turn is one history write.
+            self._pending_topic_marker = topic_marker
 
             print(f"Asking Initial Q{self.current_initial_q_index + 1}: "
                   f"'{self.current_topic_question}'")
@@ -1181,14 +1542,14 @@ class InterviewApp(QWidget):
             print("\n--- Interview Finished ---")
             self.disable_interview_controls()
             self._go_to_loading_page()
-            QTimer.singleShot(100, self._start_results_generation)
+            # Next loop turn, once the loading page has painted; the LLM work itself runs on a worker.
+            QTimer.singleShot(0, self._start_results_generation)
 
     def _start_results_generation(self):
         print("Starting results generation process...")
         self.update_status("Generating results...")
 
         self.save_transcript_to_file()
-        QApplication.processEvents()
 
         avg_speech_score = 0.0
         if self.current_speech_score_count > 0:
@@ -1203,20 +1564,49 @@ class InterviewApp(QWidget):
             #  if self.use_speech_input:
             #      self.show_message_box("warning", "Score Warning", "Speech input was enabled, but no valid scores were recorded for averaging.")
 
-        print("Generating summary review...")
-        summary = logic.generate_summary_review(self.current_full_interview_history)
-        QApplication.processEvents()
-
-        print("Generating content score analysis...")
-        content_score_data = logic.generate_content_score_analysis(self.current_full_interview_history)
-        QApplication.processEvents()
-
-        print("Generating qualification assessment...")
-        assessment_data = logic.generate_qualification_assessment(
-            self.resume_content, self.job_description_text, self.current_full_interview_history
+        print("Generating summary, content score and qualification assessment...")
+        worker = Worker(
+            self._generate_results_bundle,
+            list(self.current_full_interview_history),
+            self.resume_content,
+            self.job_description_text,
+            self.force_llm_refresh
         )
-        QApplication.processEvents()
-
+        worker.signals.finished.connect(self._on_results_generated)
+        worker.signals.error.connect(self._on_results_generation_error)
+        QThreadPool.globalInstance().start(worker)
+
+    @staticmethod
+    def _generate_results_bundle(full_history, resume_text, job_desc_text, force_refresh=False):
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            futures = {
+                ex.submit(logic.generate_summary_review, full_history,
+                          force_refresh=force_refresh): "summary",
+                ex.submit(logic.generate_content_score_analysis, full_history,
+                          force_refresh=force_refresh): "content_score",
+                ex.submit(logic.generate_qualification_assessment, resume_text,
+                          job_desc_text, full_history, force_refresh=force_refresh): "assessment",
+            }
+            # A failure in one call is reported in that call's own error form so the
+            # other two results still reach the results page.
+            results = {}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name] = future.result()
+                    print(f"Results generation: {name} ready.")
+                except Exception as e:
+                    print(f"Error generating {name}: {e}")
+                    results[name] = f"{logic.ERROR_PREFIX}{e}" if name == "summary" else {"error": str(e)}
+        return results["summary"], results["content_score"], results["assessment"]
+
+    def _on_results_generation_error(self, error_message):
+        self.update_status("Results generation failed.", False)
+        self.show_message_box("error", "Results Error", f"Could not generate interview results.\n{error_message}")
+        self._go_to_results_page(f"{logic.ERROR_PREFIX}{error_message}", None, None, 5.2)
+
+    def _on_results_generated(self, results):
+        summary, content_score_data, assessment_data = results
         self.update_status("Results ready.", False)
 
         if summary is None or (isinstance(summary, str) and summary.startswith(logic.ERROR_PREFIX)):
@@ -1234,7 +1624,7 @@ class InterviewApp(QWidget):
             print("Already recording/processing, ignoring button press.")
             return
 
-        answer_input = getattr(self.interview_page_instance, 'answer_input', None)
+        answer_input = self._answer_input
 
         if self.use_speech_input:
             print("Record button clicked, starting STT...")
@@ -1244,6 +1634,7 @@ class InterviewApp(QWidget):
             topic_idx = self.current_initial_q_index + 1
             followup_idx = self.follow_up_count
             recording.start_speech_recognition(topic_idx, followup_idx)
+            self._stt_watchdog.start()
         else:
             print("Submit button clicked, processing text answer.")
             if not answer_input:
@@ -1252,54 +1643,62 @@ class InterviewApp(QWidget):
                 return
             user_answer = answer_input.toPlainText().strip()
             if not user_answer:
-                self.show_message_box("warning", "Input Required", "Please type your answer before submitting.")
+                self.show_message_box("warning", "Input Required", "Please type your answer before submitting.", modal=False)
                 return
             self.process_answer(user_answer)
 
     def update_status_stt(self, message: str):
         if not self.status_bar_label: return
 
-        display_message = message
-        button_state = 'idle'
-
-        if message == "STT_Status: Starting Mic...":
-            display_message = "[Starting Microphone...]"
-            button_state = 'processing'
-        elif message == "STT_Status: Adjusting Mic...":
-            display_message = "[Calibrating microphone threshold...]"
-            button_state = 'processing'
-        elif message == "STT_Status: Listening...":
-            display_message = "[Listening... Speak Now]"
-            button_state = 'listening'
-        elif message == "STT_Status: Processing...":
-            display_message = "[Processing Speech... Please Wait]"
-            button_state = 'processing'
-        elif message.startswith("STT_Warning:"):
-            detail = message.split(':', 1)[1].strip()
-            display_message = f"[STT Warning: {detail}]"
-            button_state = 'idle'
-            self.is_recording = False
-        elif message.startswith("STT_Error:"):
-            detail = message.split(':', 1)[1].strip()
-            display_message = f"[STT Error: {detail}]"
-            button_state = 'idle'
-            self.is_recording = False
-        elif message.startswith("STT_Success:"):
-            display_message = "[Speech Recognized Successfully]"
-            button_state = 'processing'
-
-        self.status_bar_label.setText(display_message)
+        hit = self._STT_STATUS_MAP.get(message)
+        if hit:
+            display_message, button_state = hit
+        else:
+            display_message, button_state = message, 'idle'
+            for prefix, template, state, stops_recording in self._STT_PREFIX_MAP:
+                if message.startswith(prefix):
+                    detail = message[len(prefix):].strip()
+                    display_message = template.format(detail)
+                    button_state = state
+                    if stops_recording:
+                        self.is_recording = False
+                    break
+
+        if self.status_bar_label.text() != display_message:
+            self.status_bar_label.setText(display_message)
         self.set_recording_button_state(button_state)
-        QApplication.processEvents()
 
-    def check_stt_queue(self):
+    def _drain_stt_fallback_queue(self):
+        while True:
+            try:
+                result = recording.stt_result_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._on_stt_result(result)
+        if not self.is_recording:
+            self._stt_watchdog.stop()
+
+    def _apply_pending_stt_status(self):
+        message, self._pending_stt_status = self._pending_stt_status, None
+        if message:
+            self.update_status_stt(message)
+
+    def _on_stt_result(self, result):
         try:
-            result = recording.stt_result_queue.get_nowait()
-            print(f"STT Queue Received: {result}")
+            print(f"STT Result Received: {result}")
+
+            # Progress statuses arriving in a burst are applied once, last one wins;
+            # a warning/error/success supersedes any that are still pending.
+            if result.startswith("STT_Status:"):
+                if self._pending_stt_status is None:
+                    QTimer.singleShot(0, self._apply_pending_stt_status)
+                self._pending_stt_status = result
+                return
+            self._pending_stt_status = None
 
-            if result.startswith(("STT_Status:", "STT_Warning:", "STT_Error:")):
+            if result.startswith(("STT_Warning:", "STT_Error:")):
                 self.update_status_stt(result)
-                if result.startswith(("STT_Warning:", "STT_Error:")) and not self.is_recording:
+                if not self.is_recording:
                      print("STT Warning/Error received, enabling controls.")
                      self.enable_interview_controls()
             elif result.startswith("STT_Success:"):
@@ -1323,7 +1722,7 @@ class InterviewApp(QWidget):
                         print("Parsed Score: N/A")
 
                 except (IndexError, ValueError, TypeError) as e:
-                    print(f"Error parsing transcript/score from queue message: {e}")
+                    print(f"Error parsing transcript/score from STT message: {e}")
                     if result.startswith("STT_Success: "):
                         transcript = result[len("STT_Success: "):].strip()
                     score = None
@@ -1338,73 +1737,98 @@ class InterviewApp(QWidget):
                 self.process_answer(transcript)
 
             else:
-                 print(f"Warning: Received unknown message from STT queue: {result}")
+                 print(f"Warning: Received unknown STT message: {result}")
 
-        except queue.Empty:
-            pass
         except Exception as e:
-            print(f"Error checking STT Queue: {e}")
+            print(f"Error handling STT result: {e}")
             if self.is_recording:
                 self.is_recording = False
                 self.set_recording_button_state('idle')
                 self.enable_interview_controls()
-            self.update_status(f"Error checking speech recognition: {e}")
+            self.update_status(f"Error handling speech recognition result: {e}")
 
     def process_answer(self, user_answer: str):
         last_q = self.last_question_asked or "[Unknown Question]"
         print(f"Processing answer for Q: '{last_q[:50]}...' -> A: '{user_answer[:50]}...'")
 
-        q_data = {"q": last_q, "a": user_answer}
+        q_data = {"q": last_q, "a": user_answer, "q_clean": self._clean_question_text(last_q)}
         self.current_topic_history.append(q_data)
         self.current_full_interview_history.append(q_data)
 
-        self.add_to_history(f"Q: {last_q}", tag="question_style")
-        self.add_to_history(f"A: {user_answer}\n", tag="answer_style")
+        self.add_qa_pair(last_q, user_answer, topic_marker=self._pending_topic_marker)
+        self._pending_topic_marker = None
 
-        answer_input = getattr(self.interview_page_instance, 'answer_input', None)
-        if answer_input:
-            answer_input.clear()
+        if self._interview_ui_ready:
+            self._answer_input.clear()
 
         self.disable_interview_controls()
         self.update_status("Generating response from interviewer...", True)
         self.set_recording_button_state('processing')
-        QApplication.processEvents()
 
-        proceed_to_next_topic = False
         if self.follow_up_count < self.max_follow_ups:
-            try:
-                follow_up_q = logic.generate_follow_up_question(
-                    context_question=self.current_topic_question,
-                    user_answer=user_answer,
-                    conversation_history=self.current_topic_history
-                )
-            except Exception as e:
-                print(f"ERROR calling generate_follow_up_question: {e}")
-                follow_up_q = None
-                self.show_message_box("warning", "Follow-up Error", f"Could not generate follow-up:\n{e}")
-
-            self.update_status("", False)
-
-            if follow_up_q and follow_up_q.strip() and follow_up_q.upper() != "[END TOPIC]":
-                self.follow_up_count += 1
-                print(f"Asking Follow-up Q ({self.follow_up_count}/{self.max_follow_ups}): {follow_up_q}")
-                self.display_question(follow_up_q)
-            elif follow_up_q and follow_up_q.upper() == "[END TOPIC]":
-                print("Model signalled end of topic.")
-                proceed_to_next_topic = True
-            else:
-                print("No valid follow-up generated or generation failed.")
-                proceed_to_next_topic = True
+            worker = Worker(
+                logic.generate_follow_up_question,
+                context_question=self.current_topic_question,
+                user_answer=user_answer,
+                conversation_history=list(self.current_topic_history),
+                force_refresh=self.force_llm_refresh
+            )
+            worker.signals.finished.connect(self._on_follow_up_ready)
+            worker.signals.error.connect(self._on_follow_up_error)
+            self._pending_follow_up_signals = worker.signals
+            self._filler_timer.start()
+            QThreadPool.globalInstance().start(worker)
+            return
+
+        print(f"Max follow-ups ({self.max_follow_ups}) reached for this topic.")
+        self.update_status("", False)
+        self._advance_to_next_topic()
+
+    def _play_thinking_filler(self):
+        print("Follow-up generation is slow, playing filler TTS.")
+        self._speak_async(FOLLOW_UP_FILLER_TEXT)
+
+    def _take_pending_follow_up(self):
+        if self.sender() is not self._pending_follow_up_signals:
+            print("Ignoring stale follow-up result.")
+            return False
+        self._pending_follow_up_signals = None
+        self._filler_timer.stop()
+        self.update_status("", False)
+        return True
+
+    def _on_follow_up_error(self, error_message):
+        if not self._take_pending_follow_up():
+            return
+        print(f"ERROR calling generate_follow_up_question: {error_message}")
+        self.show_message_box("warning", "Follow-up Error", f"Could not generate follow-up:\n{error_message}", modal=False)
+        self._advance_to_next_topic()
+
+    def _on_follow_up_ready(self, follow_up_q):
+        if not self._take_pending_follow_up():
+            return
+
+        if follow_up_q and follow_up_q.strip() and follow_up_q.upper() != "[END TOPIC]":
+            self.follow_up_count += 1
+            print(f"Asking Follow-up Q ({self.follow_up_count}/{self.max_follow_ups}): {follow_up_q}")
+            self.display_question(follow_up_q)
+            return
+
+        if follow_up_q and follow_up_q.upper() == "[END TOPIC]":
+            print("Model signalled end of topic.")
         else:
-            print(f"Max follow-ups ({self.max_follow_ups}) reached for this topic.")
-            self.update_status("", False)
-            proceed_to_next_topic = True
+            print("No valid follow-up generated or generation failed.")
+        self._advance_to_next_topic()
 
-        if proceed_to_next_topic:
-            self.current_initial_q_index += 1
-            self.start_next_topic()
+    def _advance_to_next_topic(self):
+        self.current_initial_q_index += 1
+        self.start_next_topic()
 
     def _save_report(self):
+        if not self._results_ready:
+            self.show_message_box("warning", "No Data", "No results data available to save.")
+            return
+
         content_score = 0
         analysis = "N/A"
         content_error = None
@@ -1421,125 +1845,142 @@ class InterviewApp(QWidget):
             req_list = self.last_assessment_data.get("requirements", [])
             fit_text = self.last_assessment_data.get("overall_fit", "N/A")
 
-        if not self.last_content_score_data and not self.last_assessment_data and not self.current_full_interview_history:
-            self.show_message_box("warning", "No Data", "No results data available to save.")
-            return
-
-        average_speech_score = self.last_average_speech_score
-
-        report_lines = [
-            "Interview Report",
-            f"{'='*16}\n",
-            f"Speech Delivery Score: {average_speech_score}%",
-            f"{'-'*23}",
-            self.SPEECH_DESCRIPTION_PLACEHOLDER.replace('**', '').replace('*', '').replace('<i>','').replace('</i>',''),
-            "\n",
-            f"Response Content Score: {content_score}%",
-            f"{'-'*24}"
-        ]
-
-        if content_error:
-            report_lines.append(f"Content Analysis Error: {content_error}")
-        else:
-            cleaned_analysis = analysis.replace('**', '').replace('*', '')
-            report_lines.append(cleaned_analysis)
-
-        report_lines.append("\n")
-        report_lines.extend([f"Job Fit Analysis", f"{'-'*16}"])
-        if assess_error:
-             report_lines.append(f"Assessment Error: {assess_error}")
-        elif req_list:
-            for i, req in enumerate(req_list):
-                req_text = req.get('requirement', 'N/A').replace('**','').replace('*','')
-                assess_text = req.get('assessment', 'N/A').replace('**','').replace('*','')
-                resume_ev = req.get('resume_evidence', 'N/A').replace('**','').replace('*','')
-                trans_ev = req.get('transcript_evidence', 'N/A').replace('**','').replace('*','')
-
-                report_lines.append(f"\nRequirement {i+1}: {req_text}")
-                report_lines.append(f"  Assessment: {assess_text}")
-                report_lines.append(f"  Resume Evidence: {resume_ev}")
-                report_lines.append(f"  Interview Evidence: {trans_ev}")
-
-            cleaned_fit = fit_text.replace('<b>','').replace('</b>','').replace('*','')
-            report_lines.append(f"\nOverall Fit Assessment: {cleaned_fit}")
-        else:
-            report_lines.append("No specific requirements assessment details available.")
-            cleaned_fit = fit_text.replace('<b>','').replace('</b>','').replace('*','')
-            if cleaned_fit != "N/A" and not cleaned_fit.startswith("Overall fit assessment not found"):
-                 report_lines.append(f"\nOverall Fit Assessment: {cleaned_fit}")
-
-        report_content = "\n".join(report_lines)
-        default_filename = "interview_report.txt"
+        report_args = (
+            self.last_average_speech_score, self._SPEECH_DESCRIPTION_PLAIN,
+            content_score, analysis, content_error,
+            list(req_list), fit_text, assess_error
+        )
+        default_path = self._recordings_path / "interview_report.txt"
         if self.pdf_filepath:
             base = Path(self.pdf_filepath).stem
             sanitized_base = "".join(c for c in base if c.isalnum() or c in (' ', '_', '-')).rstrip()
-            default_filename = f"{sanitized_base}_interview_report.txt"
-
-        recordings_path = Path(RECORDINGS_DIR)
-        try:
-            os.makedirs(recordings_path, exist_ok=True)
-        except OSError as e:
-            print(f"Warning: Cannot ensure save directory {recordings_path} exists: {e}")
-            recordings_path = Path.home()
-
-        default_path = str(recordings_path / default_filename)
+            default_path = default_path.with_name(f"{sanitized_base}_interview_report.txt")
 
         filepath, _ = QFileDialog.getSaveFileName(
-            self, "Save Interview Report", default_path, "Text Files (*.txt);;All Files (*)"
+            self, "Save Interview Report", str(default_path), "Text Files (*.txt);;All Files (*)"
         )
 
         if filepath:
-            try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(report_content)
-                self.update_status(f"Report saved to {os.path.basename(filepath)}.")
-                self.show_message_box("info", "Report Saved", f"Saved report to:\n{filepath}")
-            except Exception as e:
-                print(f"Error saving report: {e}")
-                self.show_message_box("error", "Save Error", f"Could not save report:\n{e}")
+            self.update_status(f"Saving report to {Path(filepath).name}...")
+            worker = Worker(self._write_report_file, filepath, self._iter_report_lines(*report_args))
+            worker.signals.finished.connect(self._on_report_saved)
+            worker.signals.error.connect(self._on_report_save_error)
+            QThreadPool.globalInstance().start(worker)
         else:
             self.update_status("Report save cancelled.")
 
+    @staticmethod
+    def _iter_report_lines(average_speech_score, speech_description, content_score, analysis,
+                           content_error, req_list, fit_text, assess_error):
+        yield "Interview Report"
+        yield f"{'='*16}\n"
+        yield f"Speech Delivery Score: {average_speech_score}%"
+        yield f"{'-'*23}"
+        yield speech_description
+        yield "\n"
+        yield f"Response Content Score: {content_score}%"
+        yield f"{'-'*24}"
+
+        if content_error:
+            yield f"Content Analysis Error: {content_error}"
+        else:
+            yield _strip_markup(analysis)
+
+        cleaned_fit = _strip_markup(fit_text or "N/A")
+        yield "\n"
+        yield "Job Fit Analysis"
+        yield f"{'-'*16}"
+        if assess_error:
+            yield f"Assessment Error: {assess_error}"
+        elif req_list:
+            for i, req in enumerate(req_list):
+                yield f"\nRequirement {i+1}: {_strip_markup(req.get('requirement', 'N/A'))}"
+                yield f"  Assessment: {_strip_markup(req.get('assessment', 'N/A'))}"
+                yield f"  Resume Evidence: {_strip_markup(req.get('resume_evidence', 'N/A'))}"
+                yield f"  Interview Evidence: {_strip_markup(req.get('transcript_evidence', 'N/A'))}"
+            yield f"\nOverall Fit Assessment: {cleaned_fit}"
+        else:
+            yield "No specific requirements assessment details available."
+            if cleaned_fit != "N/A" and not cleaned_fit.startswith("Overall fit assessment not found"):
+                yield f"\nOverall Fit Assessment: {cleaned_fit}"
+
+    @staticmethod
+    def _write_report_file(filepath, lines):
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            w = f.write
+            for i, line in enumerate(lines):
+                if i:
+                    w("\n")
+                w(line)
+            f.flush()
+            os.fsync(f.fileno())
+        return filepath
+
+    def _on_report_saved(self, filepath):
+        self.update_status(f"Report saved to {Path(filepath).name}.")
+        self.show_message_box("info", "Report Saved", f"Saved report to:\n{filepath}", modal=False)
+
+    def _on_report_save_error(self, error_message):
+        print(f"Error saving report: {error_message}")
+        self.update_status("Report save failed.")
+        self.show_message_box("error", "Save Error", f"Could not save report:\n{error_message}")
+
     def _open_recordings_folder(self):
-        recordings_path = Path(RECORDINGS_DIR)
-        folder_path_str = str(recordings_path)
+        folder_path_str = str(self._recordings_path)
         print(f"Attempting to open user recordings folder: {folder_path_str}")
+        self.update_status("Opening recordings folder...")
+        # Folder creation and any fallback launcher run on the pool; only openUrl needs the GUI thread.
+        worker = Worker(recording.ensure_recordings_dir)
+        worker.signals.finished.connect(self._open_recordings_folder_url)
+        worker.signals.error.connect(self._open_recordings_folder_url)
+        QThreadPool.globalInstance().start(worker)
+
+    def _open_recordings_folder_url(self, _result=None):
+        folder_path_str = str(self._recordings_path)
+        url = QUrl.fromLocalFile(folder_path_str)
+        if QDesktopServices.openUrl(url):
+            self.update_status("Opened recordings folder.")
+            return
 
-        if not recordings_path.exists():
-            try:
-                os.makedirs(recordings_path, exist_ok=True)
-                print(f"Created recordings directory: {recordings_path}")
-            except OSError as e:
-                print(f"Error creating recordings directory: {e}")
-                self.show_message_box("error", "Folder Error", f"Could not create recordings folder at:\n{folder_path_str}")
-                self.update_status("Failed to create recordings folder.")
-                return
+        print(f"QDesktopServices failed. Trying platform fallback...")
+        self.update_status("Opening folder (using fallback)...")
+        worker = Worker(self._launch_folder_opener, folder_path_str)
+        worker.signals.finished.connect(self._on_folder_opener_done)
+        QThreadPool.globalInstance().start(worker)
 
-        url = QUrl.fromLocalFile(folder_path_str)
-        if not QDesktopServices.openUrl(url):
-            print(f"QDesktopServices failed. Trying platform fallback...")
-            self.update_status("Opening folder (using fallback)...")
-            QApplication.processEvents()
-            try:
-                system = platform.system()
-                if system == "Windows":
-                    os.startfile(os.path.normpath(folder_path_str))
-                elif system == "Darwin":
-                    subprocess.Popen(["open", folder_path_str])
-                else:
-                    subprocess.Popen(["xdg-open", folder_path_str])
-                self.update_status("Opened recordings folder (fallback).")
-            except FileNotFoundError:
-                cmd = "startfile/explorer" if system=="Windows" else ("open" if system=="Darwin" else "xdg-open")
-                print(f"Error: Command '{cmd}' not found.")
-                self.show_message_box("error", "Open Error", f"Could not find command '{cmd}' to open the folder.")
-                self.update_status("Failed to open folder (command missing).")
-            except Exception as e:
-                print(f"Fallback open error: {e}")
-                self.show_message_box("error", "Open Error", f"Could not open folder using fallback method: {e}")
-                self.update_status("Failed to open recordings folder.")
+    @staticmethod
+    def _launch_folder_opener(folder_path_str):
+        try:
+            if _SYSTEM == "Windows":
+                # ShellExecuteW in-process; no explorer.exe child to spawn.
+                os.startfile(os.path.normpath(folder_path_str))
+            elif _OPEN_CMD:
+                # Detached: no Popen object or zombie to reap, and Qt spawns it without
+                # copying this process's page tables.
+                started, _pid = QProcess.startDetached(_OPEN_CMD[0], _OPEN_CMD[1:] + [folder_path_str])
+                if not started:
+                    return ("missing_command", f"Could not start '{_OPEN_CMD_LABEL}'.")
+            else:
+                return ("missing_command", "No folder opener available.")
+        except FileNotFoundError as e:
+            # startfile has no command to miss; this means the folder itself is gone.
+            return ("error", f"{folder_path_str}\n\n{e}")
+        except Exception as e:
+            return ("error", str(e))
+        return ("ok", "")
+
+    def _on_folder_opener_done(self, result):
+        status, detail = result
+        if status == "ok":
+            self.update_status("Opened recordings folder (fallback).")
+        elif status == "missing_command":
+            print(f"Error: Command '{_OPEN_CMD_LABEL}' not found. {detail}")
+            self.show_message_box("error", "Open Error", f"Could not find command '{_OPEN_CMD_LABEL}' to open the folder.")
+            self.update_status("Failed to open folder (command missing).")
         else:
-            self.update_status("Opened recordings folder.")
+            print(f"Fallback open error: {detail}")
+            self.show_message_box("error", "Open Error", f"Could not open folder using fallback method:\n{detail}")
+            self.update_status("Failed to open recordings folder.")
 
     def start_webcam_feed(self):
         if self.webcam_stream_thread is not None and self.webcam_stream_thread.is_alive():
@@ -1601,11 +2042,12 @@ class InterviewApp(QWidget):
         print("Webcam feed stopped completely.")
 
     def _update_webcam_view(self):
-        if not self.interview_page_instance or not hasattr(self.interview_page_instance, 'webcam_view_label'):
+        webcam_label = self._webcam_view_label
+        if webcam_label is None:
             return
 
         if not self.stacked_widget or self.stacked_widget.currentIndex() != self.INTERVIEW_PAGE_INDEX:
-             if self.interview_page_instance.webcam_view_label.pixmap() is not None:
+             if webcam_label.pixmap() is not None:
                   self.interview_page_instance.set_webcam_frame(None)
              return
 
@@ -1616,8 +2058,8 @@ class InterviewApp(QWidget):
                 print("Webcam view received None sentinel, stopping UI updates and feed.")
                 self.stop_webcam_feed()
                 if self.interview_page_instance:
-                     min_w = self.interview_page_instance.webcam_view_label.minimumWidth()
-                     min_h = self.interview_page_instance.webcam_view_label.minimumHeight()
+                     min_w = webcam_label.minimumWidth()
+                     min_h = webcam_label.minimumHeight()
                      placeholder_size = QSize(max(min_w, 100), max(min_h, 75))
 
                      placeholder = QPixmap(placeholder_size)
@@ -1651,16 +2093,26 @@ class InterviewApp(QWidget):
 
 
     def closeEvent(self, event):
+        if self._closing:
+            event.accept()
+            return
+        self._closing = True
         print("Close event triggered. Cleaning up application resources...")
 
-        if hasattr(self, 'stt_timer') and self.stt_timer.isActive():
-            self.stt_timer.stop()
-            print("STT queue check timer stopped.")
+        self._config_flush_timer.stop()
+        self._flush_config()
+
+        self._tts_pool.clear()
+        tts.stop_playback()
+
+        recording.set_stt_result_listener(None)
+        self._stt_watchdog.stop()
 
         self.stop_webcam_feed()
 
-        if self.is_recording:
-            print("Attempting to signal active recording/processing threads to stop...")
+        print("Signalling recording thread to stop...")
+        if not recording.stop_speech_recognition(timeout=2.0):
+            print("Warning: Recording thread still running after 2.0s; continuing shutdown.")
 
         print("Main window cleanup finished.")
         event.accept()
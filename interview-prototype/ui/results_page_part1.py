@@ -1,5 +1,4 @@
 # ui/results_page_part1.py
-import os
 import re
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTextEdit,
@@ -14,6 +13,14 @@ from core.recording import RECORDINGS_DIR
 LARGE_FONT_SIZE = 16
 CONTENT_FONT_SIZE = 14
 
+_BLOCK_SPLIT_RE = re.compile(r'\n-{10,}\n|\n(?=Question \d+:)')
+_QUESTION_RE = re.compile(r'Question (\d+): (.*)')
+_FOLLOW_UP_RE = re.compile(r'Follow Up \(re Topic (\d+)\): (.*)')
+_ANSWER_RE = re.compile(r'Answer: (.*)')
+_ANSWER_END_RE = re.compile(r'Question \d+:|Follow Up \(re Topic \d+\):|Answer:|-{10,}')
+# Single-pass escape for transcript text placed into the HTML view.
+_HTML_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
 class ResultsPagePart1(QWidget):
     def __init__(self, parent_window, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -130,15 +137,15 @@ class ResultsPagePart1(QWidget):
         """
         Format for dark mode using colors rather than backgrounds for better readability.
         """
-        formatted_html = "<div style='line-height: 1.5;'>"
+        html_parts = ["<div style='line-height: 1.5;'>"]
+        found_entries = False
 
-        blocks = re.split(r'\n-{10,}\n|\n(?=Question \d+:)', text)
+        blocks = _BLOCK_SPLIT_RE.split(text)
 
         for block in blocks:
             if not block.strip():
                 continue
 
-            block_html = ""
             current_indent = 0
             lines = block.strip().split('\n')
             is_first_question = True
@@ -147,74 +154,74 @@ class ResultsPagePart1(QWidget):
                 line = line.strip()
                 if not line: continue
 
-                q_match = re.match(r'Question (\d+): (.*)', line)
-                fu_match = re.match(r'Follow Up \(re Topic (\d+)\): (.*)', line)
-                a_match = re.match(r'Answer: (.*)', line)
+                q_match = _QUESTION_RE.match(line)
+                fu_match = None if q_match else _FOLLOW_UP_RE.match(line)
+                a_match = None if q_match or fu_match else _ANSWER_RE.match(line)
 
                 if q_match:
                     q_num, q_text = q_match.groups()
-                    block_html += f"""
+                    html_parts.append(f"""
                     {'<hr style="border: 0; height: 1px; background-color: #555555; margin: 20px 0;">' if not is_first_question else ''}
                     <div style='margin-top: {'10' if is_first_question else '25'}px; margin-left: {current_indent}px;'>
                         <span style='font-size: {CONTENT_FONT_SIZE+2}pt; color: #4fc3f7; font-weight: bold;'>Question {q_num}:</span>
-                        <div style='margin-top: 10px; font-size: {CONTENT_FONT_SIZE}pt; color: #e0e0e0; padding-left: 10px;'>{q_text.strip()}</div>
+                        <div style='margin-top: 10px; font-size: {CONTENT_FONT_SIZE}pt; color: #e0e0e0; padding-left: 10px;'>{q_text.strip().translate(_HTML_ESCAPE_TABLE)}</div>
                     </div>
-                    """
+                    """)
                     current_indent = 25
                     is_first_question = False
                 elif fu_match:
                     topic_num, fu_text = fu_match.groups()
                     current_indent = 15
-                    block_html += f"""
+                    html_parts.append(f"""
                     <div style='margin-top: 18px; margin-left: {current_indent}px;'>
                         <span style='font-size: {CONTENT_FONT_SIZE+1}pt; color: #81d4fa; font-weight: bold;'>Follow Up (Topic {topic_num}):</span>
-                        <div style='margin-top: 8px; font-size: {CONTENT_FONT_SIZE}pt; color: #e0e0e0; padding-left: 15px;'>{fu_text.strip()}</div>
+                        <div style='margin-top: 8px; font-size: {CONTENT_FONT_SIZE}pt; color: #e0e0e0; padding-left: 15px;'>{fu_text.strip().translate(_HTML_ESCAPE_TABLE)}</div>
                     </div>
-                    """
+                    """)
                     current_indent = 40
                 elif a_match:
                     a_text = a_match.group(1)
                     next_line_index = i + 1
                     while next_line_index < len(lines) and \
-                          not re.match(r'Question \d+:', lines[next_line_index]) and \
-                          not re.match(r'Follow Up \(re Topic \d+\):', lines[next_line_index]) and \
-                          not re.match(r'Answer:', lines[next_line_index]) and \
-                          not re.match(r'-{10,}', lines[next_line_index]):
+                          not _ANSWER_END_RE.match(lines[next_line_index]):
                         a_text += "\n" + lines[next_line_index].strip()
                         next_line_index += 1
                         i += 1
 
-                    block_html += f"""
+                    html_parts.append(f"""
                     <div style='margin-top: 12px; margin-left: {current_indent}px;'>
                         <span style='font-size: {CONTENT_FONT_SIZE+1}pt; color: #ffb74d; font-weight: bold;'>Answer:</span>
-                        <div style='margin-top: 8px; font-size: {CONTENT_FONT_SIZE}pt; color: #f0f0f0; padding-left: 15px; white-space: pre-wrap;'>{a_text.strip()}</div>
+                        <div style='margin-top: 8px; font-size: {CONTENT_FONT_SIZE}pt; color: #f0f0f0; padding-left: 15px; white-space: pre-wrap;'>{a_text.strip().translate(_HTML_ESCAPE_TABLE)}</div>
                     </div>
-                    """
+                    """)
                     current_indent = 0
 
-            if block_html:
-                formatted_html += block_html
+                if q_match or fu_match or a_match:
+                    found_entries = True
 
-        formatted_html += "</div>"
+        html_parts.append("</div>")
 
-        if not re.search(r'<span.*?>', formatted_html):
+        if not found_entries:
             print("Warning: Transcript parsing failed to identify Q/A structure. Displaying raw text.")
-            return f"<pre style='font-size: {CONTENT_FONT_SIZE}pt; color: #f0f0f0; white-space: pre-wrap;'>{text}</pre>"
+            return f"<pre style='font-size: {CONTENT_FONT_SIZE}pt; color: #f0f0f0; white-space: pre-wrap;'>{text.translate(_HTML_ESCAPE_TABLE)}</pre>"
 
-        return formatted_html
+        return "".join(html_parts)
 
     def _load_transcript(self):
-        transcript_path = os.path.join(RECORDINGS_DIR, "transcript.txt")
+        transcript_path = RECORDINGS_DIR / "transcript.txt"
 
         try:
-            if os.path.exists(transcript_path):
-                with open(transcript_path, 'r', encoding='utf-8') as file:
-                    transcript_text = file.read()
+            if transcript_path.exists():
+                transcript_text = transcript_path.read_text(encoding='utf-8')
 
                 formatted_transcript = self._parse_transcript_text(transcript_text)
 
                 if self.transcript_text_edit:
-                    self.transcript_text_edit.setHtml(formatted_transcript)
+                    self.transcript_text_edit.setUpdatesEnabled(False)
+                    try:
+                        self.transcript_text_edit.setHtml(formatted_transcript)
+                    finally:
+                        self.transcript_text_edit.setUpdatesEnabled(True)
             else:
                 if self.transcript_text_edit:
                     self.transcript_text_edit.setHtml(f"<div style='color: #ff6b6b; font-size: {CONTENT_FONT_SIZE}pt;'>Transcript file not found at: {transcript_path}</div>")
@@ -255,6 +255,11 @@ class SetupPage(QWidget):
             self.openai_tts_checkbox.setEnabled(False)
         sidebar_config_layout.addWidget(self.openai_tts_checkbox)
 
+        self.fresh_questions_checkbox = QCheckBox("Fresh Questions (Skip Cache)")
+        self.fresh_questions_checkbox.setFont(font_default_xxl)
+        self.fresh_questions_checkbox.setToolTip("Ask the model again instead of reusing questions cached from a previous run with the same resume and job description.\nCached results are stored unencrypted in ~/.cache/interview-evaluator; delete that folder to clear them.")
+        sidebar_config_layout.addWidget(self.fresh_questions_checkbox)
+
         sidebar_config_layout.addStretch(1)
 
         sidebar_layout.addWidget(sidebar_config_group, stretch=1)
@@ -507,6 +512,37 @@ class SetupPage(QWidget):
 
         self.set_controls_enabled_state(pdf_loaded, jd_loaded)
 
+    def prepend_recent_resume(self, item_data: dict, max_items: int):
+        """Moves or inserts a single resume entry at the top of the list without a rebuild."""
+        resume_widget = ResumeWidget(item_data, self)
+        resume_widget.resume_selected.connect(self.parent_window._handle_resume_widget_selected)
+        self._prepend_recent_widget(self.resume_list_layout, resume_widget, 'resume_data', 'path', max_items)
+
+    def prepend_recent_jd(self, item_data: dict, max_items: int):
+        """Moves or inserts a single JD entry at the top of the list without a rebuild."""
+        jd_widget = JDWidget(item_data, self)
+        jd_widget.jd_selected.connect(self.parent_window._handle_jd_widget_selected)
+        self._prepend_recent_widget(self.jd_list_layout, jd_widget, 'jd_data', 'name', max_items)
+
+    def _prepend_recent_widget(self, layout, new_widget, data_attr: str, key: str, max_items: int):
+        # Drops the empty-list label, any older entry with the same key and anything past max_items.
+        key_value = getattr(new_widget, data_attr).get(key)
+        layout.insertWidget(0, new_widget)
+        stale = []
+        kept = 1
+        for i in range(1, layout.count()):
+            widget = layout.itemAt(i).widget()
+            if widget is None:
+                continue
+            data = getattr(widget, data_attr, None)
+            if data is None or data.get(key) == key_value or kept >= max_items:
+                stale.append(widget)
+            else:
+                kept += 1
+        for widget in stale:
+            layout.removeWidget(widget)
+            widget.deleteLater()
+
     def show_resume_selection_state(self, selected_path: str | None):
         selected_name_internal = None
         if hasattr(self, 'resume_list_layout'):
@@ -568,7 +604,7 @@ class SetupPage(QWidget):
         sidebar_controls_names = [
             'topic_minus_btn', 'topic_plus_btn', 'num_topics_label',
             'followup_minus_btn', 'followup_plus_btn', 'max_follow_ups_label',
-            'speech_checkbox', 'openai_tts_checkbox'
+            'speech_checkbox', 'openai_tts_checkbox', 'fresh_questions_checkbox'
         ]
         openai_deps_met = "openai" in tts.get_potentially_available_providers()
 
@@ -0,0 +1,27 @@
+# ui/workers.py
+import traceback
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+class WorkerSignals(QObject):
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+class Worker(QRunnable):
+    """Runs a blocking callable on a QThreadPool and reports the outcome via signals."""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            print(f"Error in background task '{getattr(self.fn, '__name__', self.fn)}': {e}")
+            traceback.print_exc()
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)